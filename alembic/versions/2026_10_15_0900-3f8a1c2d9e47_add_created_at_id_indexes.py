@@ -0,0 +1,30 @@
+"""add_created_at_id_indexes
+
+Revision ID: 3f8a1c2d9e47
+Revises: 6d5c1f7b9520
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3f8a1c2d9e47"
+down_revision = "6d5c1f7b9520"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_trainings_created_at_id", "trainings", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_users_created_at_id", "users", ["created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_created_at_id", table_name="users")
+    op.drop_index("ix_trainings_created_at_id", table_name="trainings")
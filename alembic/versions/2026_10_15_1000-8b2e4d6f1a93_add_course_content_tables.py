@@ -0,0 +1,121 @@
+"""add_course_content_tables
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f8a1c2d9e47
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = "8b2e4d6f1a93"
+down_revision = "3f8a1c2d9e47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "modules",
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("training_id", sa.Uuid(), nullable=False),
+        sa.Column("title", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column("order", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["training_id"],
+            ["trainings.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_modules_training_id"), "modules", ["training_id"], unique=False
+    )
+    op.create_table(
+        "lessons",
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("module_id", sa.Uuid(), nullable=False),
+        sa.Column("title", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum("VIDEO", "QUIZ", "TEXT", name="lessontype"),
+            nullable=False,
+        ),
+        sa.Column(
+            "content_url", sqlmodel.sql.sqltypes.AutoString(length=500), nullable=True
+        ),
+        sa.Column("content_text", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("duration_minutes", sa.Integer(), nullable=False),
+        sa.Column("order", sa.Integer(), nullable=False),
+        sa.Column("questions", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["module_id"],
+            ["modules.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_lessons_module_id"), "lessons", ["module_id"], unique=False
+    )
+    op.create_table(
+        "lesson_progress",
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("lesson_id", sa.Uuid(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("is_completed", sa.Boolean(), nullable=False),
+        sa.Column("quiz_score", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["lesson_id"],
+            ["lessons.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_lesson_progress_lesson_id"),
+        "lesson_progress",
+        ["lesson_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_lesson_progress_user_id"),
+        "lesson_progress",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_lesson_progress_user_id"), table_name="lesson_progress")
+    op.drop_index(op.f("ix_lesson_progress_lesson_id"), table_name="lesson_progress")
+    op.drop_table("lesson_progress")
+    op.drop_index(op.f("ix_lessons_module_id"), table_name="lessons")
+    op.drop_table("lessons")
+    op.execute("DROP TYPE IF EXISTS lessontype")
+    op.drop_index(op.f("ix_modules_training_id"), table_name="modules")
+    op.drop_table("modules")
@@ -0,0 +1,29 @@
+"""add_badge_user_year_unique
+
+Revision ID: c4e7a2b9d615
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c4e7a2b9d615"
+down_revision = "8b2e4d6f1a93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        "uq_badges_user_id_year_earned", "badges", ["user_id", "year_earned"]
+    )
+    # Covered by the leading column of the unique constraint's index
+    op.drop_index("ix_badges_user_id", table_name="badges")
+
+
+def downgrade() -> None:
+    op.create_index("ix_badges_user_id", "badges", ["user_id"], unique=False)
+    op.drop_constraint("uq_badges_user_id_year_earned", "badges", type_="unique")
@@ -0,0 +1,44 @@
+"""add_user_composite_indexes
+
+Revision ID: 5a9d3e1f7c28
+Revises: c4e7a2b9d615
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "5a9d3e1f7c28"
+down_revision = "c4e7a2b9d615"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_enrollments_user_training",
+        "enrollments",
+        ["user_id", "training_id"],
+        unique=True,
+    )
+    op.drop_index("ix_enrollments_user_id", table_name="enrollments")
+
+    op.create_index(
+        "ix_lesson_progress_user_lesson",
+        "lesson_progress",
+        ["user_id", "lesson_id"],
+        unique=True,
+    )
+    op.drop_index("ix_lesson_progress_user_id", table_name="lesson_progress")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_lesson_progress_user_id", "lesson_progress", ["user_id"], unique=False
+    )
+    op.drop_index("ix_lesson_progress_user_lesson", table_name="lesson_progress")
+
+    op.create_index("ix_enrollments_user_id", "enrollments", ["user_id"], unique=False)
+    op.drop_index("ix_enrollments_user_training", table_name="enrollments")
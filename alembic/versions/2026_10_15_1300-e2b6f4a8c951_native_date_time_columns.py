@@ -0,0 +1,50 @@
+"""native_date_time_columns
+
+Revision ID: e2b6f4a8c951
+Revises: 5a9d3e1f7c28
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e2b6f4a8c951"
+down_revision = "5a9d3e1f7c28"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "profiles",
+        "last_active_date",
+        type_=sa.Date(),
+        postgresql_using="last_active_date::date",
+    )
+    for column in ("start_time", "end_time"):
+        op.alter_column(
+            "training_sessions",
+            column,
+            type_=sa.Time(),
+            postgresql_using=f"{column}::time",
+        )
+
+
+def downgrade() -> None:
+    for column in ("start_time", "end_time"):
+        op.alter_column(
+            "training_sessions",
+            column,
+            type_=sqlmodel.sql.sqltypes.AutoString(length=5),
+            postgresql_using=f"to_char({column}, 'HH24:MI')",
+        )
+    op.alter_column(
+        "profiles",
+        "last_active_date",
+        type_=sqlmodel.sql.sqltypes.AutoString(),
+        postgresql_using="to_char(last_active_date, 'YYYY-MM-DD')",
+    )
@@ -0,0 +1,50 @@
+"""text_array_list_columns
+
+Revision ID: 7f1c8d3a2e64
+Revises: e2b6f4a8c951
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "7f1c8d3a2e64"
+down_revision = "e2b6f4a8c951"
+branch_labels = None
+depends_on = None
+
+_LIST_COLUMNS = {
+    "profiles": ("tech_stack", "skills"),
+    "trainings": ("prerequisites", "learning_objectives"),
+}
+
+
+def _retype(table: str, column: str, new_type: sa.types.TypeEngine, convert: str) -> None:
+    # ALTER ... USING can't hold the subquery the json <-> array conversion
+    # needs, so copy through a temporary column instead
+    tmp = f"{column}_new"
+    op.add_column(table, sa.Column(tmp, new_type, nullable=True))
+    op.execute(f"UPDATE {table} SET {tmp} = {convert.format(column=column)}")
+    op.drop_column(table, column)
+    op.alter_column(table, tmp, new_column_name=column)
+
+
+def upgrade() -> None:
+    for table, columns in _LIST_COLUMNS.items():
+        for column in columns:
+            _retype(
+                table,
+                column,
+                postgresql.ARRAY(sa.Text()),
+                "ARRAY(SELECT json_array_elements_text({column}))",
+            )
+
+
+def downgrade() -> None:
+    for table, columns in _LIST_COLUMNS.items():
+        for column in columns:
+            _retype(table, column, sa.JSON(), "to_json({column})")
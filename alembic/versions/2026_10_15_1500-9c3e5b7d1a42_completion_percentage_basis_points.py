@@ -0,0 +1,35 @@
+"""completion_percentage_basis_points
+
+Revision ID: 9c3e5b7d1a42
+Revises: 7f1c8d3a2e64
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "9c3e5b7d1a42"
+down_revision = "7f1c8d3a2e64"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "enrollments",
+        "completion_percentage",
+        type_=sa.SmallInteger(),
+        postgresql_using="round(completion_percentage * 100)::smallint",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "enrollments",
+        "completion_percentage",
+        type_=sa.Float(),
+        postgresql_using="completion_percentage / 100.0",
+    )
@@ -0,0 +1,35 @@
+"""notifications_unread_partial_index
+
+Revision ID: b7d2e9f4c138
+Revises: 9c3e5b7d1a42
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b7d2e9f4c138"
+down_revision = "9c3e5b7d1a42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notifications_unread",
+        "notifications",
+        ["user_id", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("is_read = false"),
+    )
+    op.drop_index(op.f("ix_notifications_is_read"), table_name="notifications")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_notifications_is_read"), "notifications", ["is_read"], unique=False
+    )
+    op.drop_index("ix_notifications_unread", table_name="notifications")
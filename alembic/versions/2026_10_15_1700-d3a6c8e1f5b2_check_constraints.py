@@ -0,0 +1,46 @@
+"""check_constraints
+
+Revision ID: d3a6c8e1f5b2
+Revises: b7d2e9f4c138
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d3a6c8e1f5b2"
+down_revision = "b7d2e9f4c138"
+branch_labels = None
+depends_on = None
+
+_CONSTRAINTS = [
+    ("ck_trainings_duration_hours", "trainings", "duration_hours > 0"),
+    ("ck_trainings_max_participants", "trainings", "max_participants > 0"),
+    (
+        "ck_training_sessions_max_participants",
+        "training_sessions",
+        "max_participants > 0",
+    ),
+    (
+        "ck_training_sessions_current_participants",
+        "training_sessions",
+        "current_participants >= 0 AND current_participants <= max_participants",
+    ),
+    (
+        "ck_enrollments_completion_percentage",
+        "enrollments",
+        "completion_percentage BETWEEN 0 AND 10000",
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, condition in _CONSTRAINTS:
+        op.create_check_constraint(name, table, condition)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_CONSTRAINTS):
+        op.drop_constraint(name, table, type_="check")
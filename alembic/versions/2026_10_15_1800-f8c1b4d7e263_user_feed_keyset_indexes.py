@@ -0,0 +1,41 @@
+"""user_feed_keyset_indexes
+
+Revision ID: f8c1b4d7e263
+Revises: d3a6c8e1f5b2
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f8c1b4d7e263"
+down_revision = "d3a6c8e1f5b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notifications_user_created_at_id",
+        "notifications",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+    # Leading user_id column covers plain lookups by user
+    op.drop_index(op.f("ix_notifications_user_id"), table_name="notifications")
+    op.create_index(
+        "ix_enrollments_user_created_at_id",
+        "enrollments",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_enrollments_user_created_at_id", table_name="enrollments")
+    op.create_index(
+        op.f("ix_notifications_user_id"), "notifications", ["user_id"], unique=False
+    )
+    op.drop_index("ix_notifications_user_created_at_id", table_name="notifications")
@@ -0,0 +1,37 @@
+"""lz4_compress_long_text
+
+Revision ID: 2e7a9c4f6d81
+Revises: f8c1b4d7e263
+Create Date: 2026-10-15 19:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "2e7a9c4f6d81"
+down_revision = "f8c1b4d7e263"
+branch_labels = None
+depends_on = None
+
+# Free-text columns long enough to push a row past the TOAST threshold
+_LONG_TEXT_COLUMNS = [
+    ("notifications", "message"),
+    ("trainings", "description"),
+    ("trainings", "rejection_reason"),
+    ("profiles", "bio"),
+]
+
+
+def upgrade() -> None:
+    # PostgreSQL 14+. Applies to values compressed from now on; existing
+    # ones keep pglz until they are rewritten. Storage stays EXTENDED so
+    # values are still compressed before being moved out of line.
+    for table, column in _LONG_TEXT_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for table, column in _LONG_TEXT_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION DEFAULT")
@@ -0,0 +1,33 @@
+"""trainings_category_keyset_index
+
+Revision ID: 6b4f2d8a1c57
+Revises: 2e7a9c4f6d81
+Create Date: 2026-10-15 20:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "6b4f2d8a1c57"
+down_revision = "2e7a9c4f6d81"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_trainings_category_created_at_id",
+        "trainings",
+        ["category", "created_at", "id"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_trainings_category"), table_name="trainings")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_trainings_category"), "trainings", ["category"], unique=False
+    )
+    op.drop_index("ix_trainings_category_created_at_id", table_name="trainings")
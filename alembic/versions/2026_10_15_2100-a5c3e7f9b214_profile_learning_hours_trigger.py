@@ -0,0 +1,92 @@
+"""profile_learning_hours_trigger
+
+Revision ID: a5c3e7f9b214
+Revises: 6b4f2d8a1c57
+Create Date: 2026-10-15 21:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a5c3e7f9b214"
+down_revision = "6b4f2d8a1c57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep profiles.total_learning_hours equal to the user's summed
+    # training_completions.learning_hours by applying each row's delta.
+    # Mirrored as after_create DDL in src/models/completion.py and
+    # src/models/profile.py; keep the SQL in step.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION update_profile_learning_hours() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE profiles
+                SET total_learning_hours = total_learning_hours - OLD.learning_hours
+                WHERE user_id = OLD.user_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE profiles
+                SET total_learning_hours = total_learning_hours + NEW.learning_hours
+                WHERE user_id = NEW.user_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_training_completions_profile_hours
+        AFTER INSERT OR DELETE OR UPDATE OF learning_hours, user_id
+        ON training_completions
+        FOR EACH ROW EXECUTE FUNCTION update_profile_learning_hours()
+        """
+    )
+
+    # Profiles are created lazily, possibly after completions exist
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION init_profile_learning_hours() RETURNS trigger AS $$
+        BEGIN
+            SELECT coalesce(sum(learning_hours), 0) INTO NEW.total_learning_hours
+            FROM training_completions
+            WHERE user_id = NEW.user_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_profiles_init_learning_hours
+        BEFORE INSERT ON profiles
+        FOR EACH ROW EXECUTE FUNCTION init_profile_learning_hours()
+        """
+    )
+
+    op.execute(
+        """
+        UPDATE profiles AS p
+        SET total_learning_hours = coalesce(
+            (SELECT sum(c.learning_hours) FROM training_completions AS c
+             WHERE c.user_id = p.user_id),
+            0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_profiles_init_learning_hours ON profiles")
+    op.execute("DROP FUNCTION IF EXISTS init_profile_learning_hours()")
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_training_completions_profile_hours"
+        " ON training_completions"
+    )
+    op.execute("DROP FUNCTION IF EXISTS update_profile_learning_hours()")
@@ -0,0 +1,36 @@
+"""updated_at_indexes
+
+Revision ID: 4d9e1a6c3b75
+Revises: a5c3e7f9b214
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "4d9e1a6c3b75"
+down_revision = "a5c3e7f9b214"
+branch_labels = None
+depends_on = None
+
+# Tables whose MAX(updated_at) makes up the dashboard ETag
+_TABLES = (
+    "trainings",
+    "enrollments",
+    "training_completions",
+    "badges",
+    "users",
+    "departments",
+)
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.create_index(f"ix_{table}_updated_at", table, ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.drop_index(f"ix_{table}_updated_at", table_name=table)
@@ -1,7 +1,7 @@
 """Script to populate database with mock data for testing and development."""
 
 import asyncio
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from uuid import UUID
 
 from contextlib import asynccontextmanager
@@ -465,8 +465,8 @@ async def seed_training_sessions(
         past_session = TrainingSession(
             training_id=training.id,
             session_date=date.today() - timedelta(days=30),
-            start_time="09:00",
-            end_time="17:00",
+            start_time=time(9, 0),
+            end_time=time(17, 0),
             location="Conference Room A",
             instructor_name="Dr. Jane Expert",
             max_participants=training.max_participants,
@@ -478,8 +478,8 @@ async def seed_training_sessions(
         upcoming_session = TrainingSession(
             training_id=training.id,
             session_date=date.today() + timedelta(days=14),
-            start_time="10:00",
-            end_time="18:00",
+            start_time=time(10, 0),
+            end_time=time(18, 0),
             location="Conference Room B",
             instructor_name="Prof. John Instructor",
             max_participants=training.max_participants,
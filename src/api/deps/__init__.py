@@ -6,10 +6,26 @@ from src.api.deps.auth import (
     oauth2_scheme,
     require_roles,
 )
+from src.api.deps.cache import apply_etag, entity_etag, etag_matches
+from src.api.deps.pagination import (
+    MAX_PAGE_SIZE,
+    Cursor,
+    PageLimit,
+    decode_cursor,
+    encode_cursor,
+)
 
 __all__ = [
     "get_current_user",
     "get_current_active_user",
     "require_roles",
     "oauth2_scheme",
+    "apply_etag",
+    "etag_matches",
+    "entity_etag",
+    "Cursor",
+    "PageLimit",
+    "MAX_PAGE_SIZE",
+    "decode_cursor",
+    "encode_cursor",
 ]
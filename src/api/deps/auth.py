@@ -5,7 +5,7 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
+from jwt import PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.db import get_session
@@ -43,7 +43,7 @@ async def get_current_user(
         # Decode token
         payload = decode_access_token(token)
         user_id, roles = verify_token_claims(payload)
-    except (JWTError, ValueError) as e:
+    except (PyJWTError, ValueError) as e:
         raise credentials_exception from e
 
     # Fetch user from database
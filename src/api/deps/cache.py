@@ -0,0 +1,77 @@
+"""HTTP conditional-request helpers for cacheable GET routes."""
+
+import hashlib
+
+from fastapi import Request, Response
+
+from src.core.errors import NotModifiedError
+
+# Per-user entity reads: browsers may reuse for 30s, then must revalidate
+PRIVATE_REVALIDATE = "private, max-age=30, must-revalidate"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag.
+
+    Uses weak comparison (RFC 9110), so W/ prefixes are ignored.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current quoted entity tag
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in if_none_match.split(",")
+    )
+
+
+def entity_etag(*parts: object) -> str:
+    """
+    Build a weak ETag from the values that identify a representation.
+
+    Args:
+        parts: Version markers, e.g. ids and updated_at timestamps
+
+    Returns:
+        Quoted weak entity tag
+    """
+    digest = hashlib.md5(
+        "|".join(map(str, parts)).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def apply_etag(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str | None = None,
+) -> None:
+    """
+    Attach an ETag to the response or short-circuit with 304.
+
+    Args:
+        request: Incoming request (read for If-None-Match)
+        response: Response whose headers receive the ETag
+        etag: Current quoted entity tag
+        cache_control: Cache-Control value sent with both 200 and 304
+
+    Raises:
+        NotModifiedError: If the client already holds this representation
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise NotModifiedError(etag, cache_control)
+
+    response.headers["ETag"] = etag
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
@@ -0,0 +1,68 @@
+"""Pagination helpers for list routes: page-size bounds and keyset cursors."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+
+Cursor = tuple[datetime, UUID]
+
+# Pages are buffered whole before serialization, so bound their size
+MAX_PAGE_SIZE = 500
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+# For feeds that return everything unless a page size is asked for
+OptionalPageLimit = Annotated[int | None, Query(ge=1, le=MAX_PAGE_SIZE)]
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Build an opaque cursor pointing just past a row.
+
+    Args:
+        created_at: Row creation timestamp
+        row_id: Row primary key (tie-breaker)
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    payload = json.dumps([created_at.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(
+    after: str | None = Query(
+        default=None, description="Cursor from a previous page's next_cursor"
+    ),
+) -> Cursor | None:
+    """
+    FastAPI dependency: decode the ``after`` query parameter.
+
+    Args:
+        after: Cursor returned as next_cursor by the previous page
+
+    Returns:
+        (created_at, id) of the last row already seen, or None
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if after is None:
+        return None
+
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(after.encode()))
+        cursor = datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        cursor = None
+
+    # Timestamps are stored as naive UTC; an offset would fail in the driver
+    if cursor is None or cursor[0].tzinfo is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+    return cursor
@@ -10,7 +10,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import get_settings
 from src.core.db import get_session
-from src.core.security import create_access_token, hash_password, verify_password
+from src.core.security import (
+    create_access_token,
+    hash_password_async,
+    verify_password_async,
+)
 from src.models.user import User, UserRole
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -35,7 +39,7 @@ async def register(
     # Create user
     user = User(
         email=email,
-        hashed_password=hash_password(password),
+        hashed_password=await hash_password_async(password),
         full_name=full_name,
         role=UserRole.EMPLOYEE,
     )
@@ -61,7 +65,9 @@ async def login(
     result = await session.execute(select(User).where(User.email == form_data.username))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -10,25 +10,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.db import get_session
 from src.core.notifications import notify_badge_earned
-from src.models.badge import Badge, BadgeType
+from src.models.badge import (
+    BADGE_TIER_HOURS,
+    BADGE_TIERS,
+    Badge,
+    BadgeType,
+    badge_type_for_hours,
+)
 from src.models.completion import TrainingCompletion
 
 router = APIRouter(prefix="/badges", tags=["badges"])
 
 
-def determine_badge_type(hours: float) -> BadgeType | None:
-    """Determine badge type based on learning hours."""
-    if hours >= 80:
-        return BadgeType.PLATINUM
-    elif hours >= 60:
-        return BadgeType.GOLD
-    elif hours >= 40:
-        return BadgeType.SILVER
-    elif hours >= 20:
-        return BadgeType.BRONZE
-    return None
-
-
 @router.post("/calculate/{user_id}/{year}")
 async def calculate_and_award_badge(
     user_id: UUID,
@@ -76,7 +69,7 @@ async def calculate_and_award_badge(
     total_trainings = len(completions)
 
     # Determine badge type
-    badge_type = determine_badge_type(total_hours)
+    badge_type = badge_type_for_hours(total_hours)
 
     if not badge_type:
         raise HTTPException(
@@ -96,12 +89,13 @@ async def calculate_and_award_badge(
     session.add(badge)
 
     # Create notification
-    await notify_badge_earned(
-        session=session,
-        user_id=user_id,
-        badge_type=badge_type.value,
-        year=year,
-        hours=total_hours,
+    session.add(
+        notify_badge_earned(
+            user_id=user_id,
+            badge_type=badge_type.value,
+            year=year,
+            hours=total_hours,
+        )
     )
 
     await session.commit()
@@ -211,24 +205,15 @@ async def get_user_badge_statistics(
     current_completions = current_completions_result.scalars().all()
 
     current_year_hours = sum(c.learning_hours for c in current_completions)
-    next_badge = determine_badge_type(current_year_hours)
-    hours_to_next = 0
-
-    if not next_badge:
-        hours_to_next = 20 - current_year_hours
-        next_badge_name = "BRONZE"
-    elif next_badge == BadgeType.BRONZE:
-        hours_to_next = 40 - current_year_hours
-        next_badge_name = "SILVER"
-    elif next_badge == BadgeType.SILVER:
-        hours_to_next = 60 - current_year_hours
-        next_badge_name = "GOLD"
-    elif next_badge == BadgeType.GOLD:
-        hours_to_next = 80 - current_year_hours
-        next_badge_name = "PLATINUM"
+    current_badge = badge_type_for_hours(current_year_hours)
+    next_tier = BADGE_TIERS.index(current_badge) + 1 if current_badge else 0
+
+    if next_tier < len(BADGE_TIERS):
+        hours_to_next = BADGE_TIER_HOURS[next_tier] - current_year_hours
+        next_badge_name = BADGE_TIERS[next_tier].value
     else:
         hours_to_next = 0
-        next_badge_name = "PLATINUM (Achieved)"
+        next_badge_name = f"{BADGE_TIERS[-1].value} (Achieved)"
 
     return {
         "total_badges": len(badges),
@@ -4,10 +4,11 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db import get_session
+from src.api.deps.pagination import Cursor, OptionalPageLimit, decode_cursor, encode_cursor
+from src.core.db import get_ro_session, get_session
 from src.core.notifications import notify_enrollment_confirmed
 from src.models.enrollment import Enrollment, EnrollmentStatus
 from src.models.training import Training
@@ -56,10 +57,11 @@ async def enroll_in_training(
     session.add(enrollment)
 
     # Create notification
-    await notify_enrollment_confirmed(
-        session=session,
-        user_id=user_id,
-        training_title=training.title,
+    session.add(
+        notify_enrollment_confirmed(
+            user_id=user_id,
+            training_title=training.title,
+        )
     )
 
     await session.commit()
@@ -77,17 +79,33 @@ async def enroll_in_training(
 @router.get("/user/{user_id}")
 async def get_user_enrollments(
     user_id: UUID,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
+    cursor: Annotated[Cursor | None, Depends(decode_cursor)],
+    limit: OptionalPageLimit = None,
 ):
-    """Get user's enrollments."""
+    """
+    Get user's enrollments, newest first.
+
+    Without ``limit`` every enrollment is returned. With it, pass the
+    previous page's next_cursor as ``after`` to page through them.
+    """
     query = (
         select(Enrollment, Training.title)
         .join(Training, Enrollment.training_id == Training.id)
         .where(Enrollment.user_id == user_id)
+        .order_by(Enrollment.created_at.desc(), Enrollment.id.desc())
     )
+    if cursor:
+        query = query.where(tuple_(Enrollment.created_at, Enrollment.id) < cursor)
+    if limit:
+        query = query.limit(limit)
+
     result = await session.execute(query)
     rows = result.all()
 
+    paged = limit is not None or cursor is not None
+    last = rows[-1].Enrollment if limit and len(rows) == limit else None
+
     return {
         "items": [
             {
@@ -100,7 +118,8 @@ async def get_user_enrollments(
             }
             for e, title in rows
         ],
-        "total": len(rows),
+        "total": None if paged else len(rows),
+        "next_cursor": encode_cursor(last.created_at, last.id) if last else None,
     }
 
 
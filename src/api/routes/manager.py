@@ -5,18 +5,27 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.db import get_session
-from src.core.notifications import notify_training_assigned
+from src.core.notifications import notify_training_assigned, notify_training_assigned_bulk
 from src.models.enrollment import Enrollment, EnrollmentStatus
+from src.models.loaders import load_enrollment_full
 from src.models.training import Training
 from src.models.user import User
 
 router = APIRouter(prefix="/manager", tags=["manager"])
 
 
+class BulkAssignRequest(BaseModel):
+    training_id: UUID
+    user_ids: list[UUID] = Field(min_length=1, max_length=500)
+    manager_id: UUID | None = None
+    session_id: UUID | None = None
+
+
 @router.post("/assign-training")
 async def assign_training_to_team_member(
     user_id: UUID,
@@ -75,11 +84,12 @@ async def assign_training_to_team_member(
         if manager:
             manager_name = manager.full_name
 
-    await notify_training_assigned(
-        session=session,
-        user_id=user_id,
-        training_title=training.title,
-        assigned_by_name=manager_name,
+    session.add(
+        notify_training_assigned(
+            user_id=user_id,
+            training_title=training.title,
+            assigned_by_name=manager_name,
+        )
     )
 
     await session.commit()
@@ -96,6 +106,57 @@ async def assign_training_to_team_member(
     }
 
 
+@router.post("/assign-training/bulk")
+async def bulk_assign_training(
+    body: BulkAssignRequest,
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Assign a training to several users at once (manager only - auth disabled for now)."""
+    training = await session.get(Training, body.training_id)
+    if not training:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Training not found",
+        )
+
+    manager_name = "Manager"
+    if body.manager_id:
+        manager = await session.get(User, body.manager_id)
+        if manager:
+            manager_name = manager.full_name
+
+    # Unknown users would fail the whole INSERT on the foreign key
+    result = await session.execute(select(User.id).where(User.id.in_(body.user_ids)))
+    existing_ids = set(result.scalars())
+
+    # One INSERT for the enrollments, one for the notifications
+    enrolled = await Enrollment.bulk_assign(
+        session,
+        body.training_id,
+        [user_id for user_id in body.user_ids if user_id in existing_ids],
+        assigned_by_id=body.manager_id,
+        session_id=body.session_id,
+    )
+    await notify_training_assigned_bulk(
+        session, list(enrolled), training.title, manager_name
+    )
+
+    await session.commit()
+
+    return {
+        "assigned": [
+            {"user_id": user_id, "enrollment_id": enrollment_id}
+            for user_id, enrollment_id in enrolled.items()
+        ],
+        "skipped": [
+            user_id
+            for user_id in dict.fromkeys(body.user_ids)
+            if user_id not in enrolled
+        ],
+        "message": f"Training assigned to {len(enrolled)} user(s)",
+    }
+
+
 @router.get("/team")
 async def get_team_members(
     manager_id: UUID,
@@ -142,29 +203,29 @@ async def get_team_training_progress(
 
     team_member_ids = [user.id for user in team_members]
 
-    # Get all enrollments for team members
+    # Get all enrollments for team members, with user and training details
     enrollments_query = (
         select(Enrollment)
         .where(Enrollment.user_id.in_(team_member_ids))
+        .options(*load_enrollment_full())
         .offset(skip)
         .limit(limit)
     )
     enrollments_result = await session.execute(enrollments_query)
     enrollments = enrollments_result.scalars().all()
 
-    # Build response with user and training details
     items = []
     for enrollment in enrollments:
-        user = await session.get(User, enrollment.user_id)
-        training = await session.get(Training, enrollment.training_id)
+        user = enrollment.user
+        training = enrollment.training
 
         items.append(
             {
                 "enrollment_id": str(enrollment.id),
-                "user_name": user.full_name if user else "Unknown",
-                "user_email": user.email if user else "Unknown",
-                "training_title": training.title if training else "Unknown",
-                "training_category": training.category if training else "Unknown",
+                "user_name": user.full_name,
+                "user_email": user.email,
+                "training_title": training.title,
+                "training_category": training.category,
                 "status": enrollment.status.value,
                 "completion_percentage": enrollment.completion_percentage,
                 "is_assigned": enrollment.is_assigned,
@@ -4,48 +4,68 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db import get_session
+from src.api.deps.pagination import Cursor, OptionalPageLimit, decode_cursor, encode_cursor
+from src.core.db import get_ro_session, get_session
 from src.models.notification import Notification
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 
-@router.get("/user/{user_id}")
+@router.get("/user/{user_id}", response_class=ORJSONResponse)
 async def get_user_notifications(
     user_id: UUID,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
+    cursor: Annotated[Cursor | None, Depends(decode_cursor)],
     unread_only: bool = False,
+    limit: OptionalPageLimit = None,
 ):
-    """Get user's notifications."""
-    query = select(Notification).where(Notification.user_id == user_id)
+    """
+    Get user's notifications, newest first.
+
+    Without ``limit`` every notification is returned. With it, pass the
+    previous page's next_cursor as ``after`` to page through the feed.
+    """
+    query = select(
+        Notification.id,
+        Notification.notification_type,
+        Notification.title,
+        Notification.message,
+        Notification.is_read,
+        Notification.action_url,
+        Notification.created_at,
+    ).where(Notification.user_id == user_id)
 
     if unread_only:
         query = query.where(Notification.is_read == False)
+    if cursor:
+        query = query.where(tuple_(Notification.created_at, Notification.id) < cursor)
+
+    query = query.order_by(Notification.created_at.desc(), Notification.id.desc())
+    if limit:
+        query = query.limit(limit)
+
+    result = await session.execute(query)
+    items = [row._asdict() for row in result]
+
+    paged = limit is not None or cursor is not None
+    last = items[-1] if limit and len(items) == limit else None
+
+    # orjson encodes the UUID, enum and datetime values natively, so return
+    # the response directly and skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse(
+        {
+            "items": items,
+            "total": None if paged else len(items),
+            "next_cursor": encode_cursor(last["created_at"], last["id"]) if last else None,
+        }
+    )
+
 
-    result = await session.execute(query.order_by(Notification.created_at.desc()))
-    notifications = result.scalars().all()
-
-    return {
-        "items": [
-            {
-                "id": str(n.id),
-                "notification_type": n.notification_type.value,
-                "title": n.title,
-                "message": n.message,
-                "is_read": n.is_read,
-                "action_url": n.action_url,
-                "created_at": n.created_at.isoformat(),
-            }
-            for n in notifications
-        ],
-        "total": len(notifications),
-    }
-
-
-@router.patch("/{notification_id}/read")
+@router.patch("/{notification_id}/read", response_class=ORJSONResponse)
 async def mark_notification_read(
     notification_id: UUID,
     session: Annotated[AsyncSession, Depends(get_session)],
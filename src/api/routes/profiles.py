@@ -31,10 +31,10 @@ async def get_profile(
 
     # Streak Logic
     from datetime import datetime, timedelta
-    today = datetime.utcnow().date().isoformat()
+    today = datetime.utcnow().date()
     
     if profile.last_active_date != today:
-        yesterday = (datetime.utcnow().date() - timedelta(days=1)).isoformat()
+        yesterday = today - timedelta(days=1)
         
         if profile.last_active_date == yesterday:
             profile.streak_count += 1
@@ -1,13 +1,15 @@
 """Reporting and analytics routes."""
 
+from collections import defaultdict
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db import get_session
+from src.api.deps.cache import apply_etag, entity_etag
+from src.core.db import get_ro_session, get_session
 from src.models.badge import Badge
 from src.models.completion import TrainingCompletion
 from src.models.department import Department
@@ -17,6 +19,33 @@ from src.models.user import User
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+# Tables aggregated by the admin dashboards
+_DASHBOARD_MODELS = (Training, Enrollment, TrainingCompletion, Badge, User, Department)
+
+
+async def dashboard_etag(
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
+) -> None:
+    """
+    Revalidate admin dashboards against a cheap change marker.
+
+    The ETag hashes MAX(updated_at) and the row count of every dashboard
+    table, fetched in a single query, so a matching If-None-Match returns
+    304 without running the aggregation. The counts make deletes move the
+    tag too. Routes using this take the same get_ro_session dependency,
+    which FastAPI resolves once per request, so the check and the report
+    share one connection.
+    """
+    markers = []
+    for model in _DASHBOARD_MODELS:
+        markers.append(select(func.max(model.updated_at)).scalar_subquery())
+        markers.append(select(func.count()).select_from(model).scalar_subquery())
+
+    row = (await session.execute(select(*markers))).one()
+    apply_etag(request, response, entity_etag(*row))
+
 
 # ============================================================================
 # User Reports
@@ -272,20 +301,23 @@ async def get_team_completion_statistics(
     total_hours = sum(c.learning_hours for c in all_completions)
     avg_hours_per_member = total_hours / len(team_members) if team_members else 0
 
-    # Calculate per-member stats for top performers
-    member_stats = []
-    for member in team_members:
-        member_completions = [c for c in all_completions if c.user_id == member.id]
-        member_hours = sum(c.learning_hours for c in member_completions)
+    # Group completions by user in a single pass
+    hours_by_user: defaultdict[UUID, float] = defaultdict(float)
+    count_by_user: defaultdict[UUID, int] = defaultdict(int)
+    for c in all_completions:
+        hours_by_user[c.user_id] += c.learning_hours
+        count_by_user[c.user_id] += 1
 
-        member_stats.append(
-            {
-                "user_id": str(member.id),
-                "full_name": member.full_name,
-                "completions": len(member_completions),
-                "learning_hours": member_hours,
-            }
-        )
+    # Calculate per-member stats for top performers
+    member_stats = [
+        {
+            "user_id": str(member.id),
+            "full_name": member.full_name,
+            "completions": count_by_user[member.id],
+            "learning_hours": hours_by_user[member.id],
+        }
+        for member in team_members
+    ]
 
     # Sort by hours and get top 5
     top_performers = sorted(
@@ -311,9 +343,12 @@ async def get_team_completion_statistics(
 # ============================================================================
 
 
-@router.get("/admin/training-stats")
+@router.get(
+    "/admin/training-stats",
+    dependencies=[Depends(dashboard_etag)],
+)
 async def get_overall_training_statistics(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
 ):
     """
     Get overall training statistics across the organization.
@@ -395,9 +430,12 @@ async def get_overall_training_statistics(
     }
 
 
-@router.get("/admin/top-learners")
+@router.get(
+    "/admin/top-learners",
+    dependencies=[Depends(dashboard_etag)],
+)
 async def get_top_learners(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
     limit: int = 10,
 ):
     """Get top learners by total learning hours."""
@@ -432,89 +470,101 @@ async def get_top_learners(
     ]
 
 
-@router.get("/admin/department-stats")
+@router.get(
+    "/admin/department-stats",
+    dependencies=[Depends(dashboard_etag)],
+)
 async def get_department_statistics(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
+    skip: int = 0,
+    limit: int = 100,
 ):
     """
     Get department-wise analytics.
 
-    Shows training participation and completion rates by department.
+    Shows training participation and completion rates by department,
+    ordered by total learning hours.
     """
-    # Get all departments
-    departments_query = select(Department)
-    departments_result = await session.execute(departments_query)
-    departments = departments_result.scalars().all()
-
-    department_stats = []
-    for dept in departments:
-        # Get users in department
-        users_query = select(User).where(User.department_id == dept.id)
-        users_result = await session.execute(users_query)
-        dept_users = users_result.scalars().all()
-
-        if not dept_users:
-            department_stats.append(
-                {
-                    "department_id": str(dept.id),
-                    "department_name": dept.name,
-                    "employee_count": 0,
-                    "total_enrollments": 0,
-                    "total_completions": 0,
-                    "total_learning_hours": 0,
-                    "completion_rate_percentage": 0,
-                }
-            )
-            continue
-
-        user_ids = [u.id for u in dept_users]
-
-        # Get enrollments
-        enrollments_query = select(Enrollment).where(Enrollment.user_id.in_(user_ids))
-        enrollments_result = await session.execute(enrollments_query)
-        dept_enrollments = enrollments_result.scalars().all()
+    # Per-department aggregates, each grouped once over the whole table
+    employees = (
+        select(User.department_id, func.count(User.id).label("employee_count"))
+        .group_by(User.department_id)
+        .subquery()
+    )
+    enrollments = (
+        select(User.department_id, func.count(Enrollment.id).label("enrollment_count"))
+        .join(User, Enrollment.user_id == User.id)
+        .group_by(User.department_id)
+        .subquery()
+    )
+    completions = (
+        select(
+            User.department_id,
+            func.count(TrainingCompletion.id).label("completion_count"),
+            func.sum(TrainingCompletion.learning_hours).label("total_hours"),
+        )
+        .join(User, TrainingCompletion.user_id == User.id)
+        .group_by(User.department_id)
+        .subquery()
+    )
 
-        # Get completions
-        completions_query = select(TrainingCompletion).where(
-            TrainingCompletion.user_id.in_(user_ids)
+    total_hours = func.coalesce(completions.c.total_hours, 0)
+    stats_query = (
+        select(
+            Department.id,
+            Department.name,
+            func.coalesce(employees.c.employee_count, 0).label("employee_count"),
+            func.coalesce(enrollments.c.enrollment_count, 0).label("enrollment_count"),
+            func.coalesce(completions.c.completion_count, 0).label("completion_count"),
+            total_hours.label("total_hours"),
         )
-        completions_result = await session.execute(completions_query)
-        dept_completions = completions_result.scalars().all()
+        .outerjoin(employees, employees.c.department_id == Department.id)
+        .outerjoin(enrollments, enrollments.c.department_id == Department.id)
+        .outerjoin(completions, completions.c.department_id == Department.id)
+        .order_by(total_hours.desc(), Department.name)
+        .offset(skip)
+        .limit(limit)
+    )
+    count_query = select(func.count(Department.id))
+
+    total_departments = (await session.execute(count_query)).scalar() or 0
+    rows = (await session.execute(stats_query)).all()
 
-        total_hours = sum(c.learning_hours for c in dept_completions)
+    department_stats = []
+    for row in rows:
+        hours = float(row.total_hours)
         completion_rate = (
-            len(dept_completions) / len(dept_enrollments) * 100
-            if dept_enrollments
+            row.completion_count / row.enrollment_count * 100
+            if row.enrollment_count
             else 0
         )
-
         department_stats.append(
             {
-                "department_id": str(dept.id),
-                "department_name": dept.name,
-                "employee_count": len(dept_users),
-                "total_enrollments": len(dept_enrollments),
-                "total_completions": len(dept_completions),
-                "total_learning_hours": total_hours,
+                "department_id": str(row.id),
+                "department_name": row.name,
+                "employee_count": row.employee_count,
+                "total_enrollments": row.enrollment_count,
+                "total_completions": row.completion_count,
+                "total_learning_hours": hours,
                 "completion_rate_percentage": round(completion_rate, 2),
                 "avg_hours_per_employee": (
-                    round(total_hours / len(dept_users), 2) if dept_users else 0
+                    round(hours / row.employee_count, 2) if row.employee_count else 0
                 ),
             }
         )
 
-    # Sort by total learning hours
-    department_stats.sort(key=lambda x: x["total_learning_hours"], reverse=True)
-
     return {
-        "total_departments": len(departments),
+        "total_departments": total_departments,
         "departments": department_stats,
     }
 
 
-@router.get("/admin/badge-distribution")
+@router.get(
+    "/admin/badge-distribution",
+    dependencies=[Depends(dashboard_etag)],
+)
 async def get_badge_distribution(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
     year: int | None = None,
 ):
     """
@@ -1,18 +1,57 @@
 """Training session routes."""
 
-from datetime import date
+import re
+from datetime import date, time
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import delete, exists, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db import get_session
+from src.core.db import get_session, uuid7
 from src.models.training import Training, TrainingSession
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
+# CHECK that keeps current_participants within max_participants
+_CAPACITY_CHECK = "ck_training_sessions_current_participants"
+
+
+def _violated_constraint(exc: IntegrityError) -> str | None:
+    """Return the name of the constraint behind an IntegrityError, if known.
+
+    asyncpg exposes it on the driver error chained under the DBAPI wrapper;
+    drivers without that attribute only carry it in the message text.
+    """
+    orig = exc.orig
+    for err in (orig, getattr(orig, "__cause__", None)):
+        name = getattr(err, "constraint_name", None)
+        if name:
+            return name
+    if _CAPACITY_CHECK in str(orig):
+        return _CAPACITY_CHECK
+    return None
+
+# 24-hour HH:MM, e.g. "09:30" or "23:59"
+_HHMM = re.compile(r"(?:[01]\d|2[0-3]):[0-5]\d")
+
+
+def _parse_hhmm(value: str) -> time:
+    """
+    Parse an HH:MM query parameter into a time.
+
+    Raises:
+        HTTPException: If the value is not in HH:MM format
+    """
+    if not _HHMM.fullmatch(value):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Time must be in HH:MM format",
+        )
+    return time.fromisoformat(value)
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_session(
@@ -22,47 +61,50 @@ async def create_session(
     end_time: str,
     location: str,
     instructor_name: str,
-    max_participants: int,
+    max_participants: Annotated[int, Query(gt=0)],
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
     """Create a new training session."""
-    # Verify training exists
-    result = await session.execute(select(Training).where(Training.id == training_id))
-    training = result.scalar_one_or_none()
+    # Insert only if the training exists: INSERT ... SELECT ... WHERE EXISTS
+    values = {
+        "id": uuid7(),
+        "training_id": training_id,
+        "session_date": session_date,
+        "start_time": _parse_hhmm(start_time),
+        "end_time": _parse_hhmm(end_time),
+        "location": location,
+        "instructor_name": instructor_name,
+        "max_participants": max_participants,
+        "current_participants": 0,
+    }
+    columns = TrainingSession.__table__.c
+    stmt = (
+        insert(TrainingSession)
+        .from_select(
+            list(values),
+            select(
+                *(literal(value, columns[name].type) for name, value in values.items())
+            ).where(exists().where(Training.id == training_id)),
+        )
+        .returning(TrainingSession)
+    )
+    result = await session.execute(stmt)
+    training_session = result.scalar_one_or_none()
 
-    if not training:
+    if not training_session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Training not found",
         )
 
-    # Validate time format (basic check)
-    if len(start_time) != 5 or len(end_time) != 5:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Time must be in HH:MM format",
-        )
-
-    training_session = TrainingSession(
-        training_id=training_id,
-        session_date=session_date,
-        start_time=start_time,
-        end_time=end_time,
-        location=location,
-        instructor_name=instructor_name,
-        max_participants=max_participants,
-        current_participants=0,
-    )
-    session.add(training_session)
     await session.commit()
-    await session.refresh(training_session)
 
     return {
         "id": str(training_session.id),
         "training_id": str(training_session.training_id),
         "session_date": training_session.session_date.isoformat(),
-        "start_time": training_session.start_time,
-        "end_time": training_session.end_time,
+        "start_time": training_session.start_time.isoformat(timespec="minutes"),
+        "end_time": training_session.end_time.isoformat(timespec="minutes"),
         "location": training_session.location,
         "instructor_name": training_session.instructor_name,
         "max_participants": training_session.max_participants,
@@ -100,8 +142,8 @@ async def list_sessions_for_training(
             "id": str(sess.id),
             "training_id": str(sess.training_id),
             "session_date": sess.session_date.isoformat(),
-            "start_time": sess.start_time,
-            "end_time": sess.end_time,
+            "start_time": sess.start_time.isoformat(timespec="minutes"),
+            "end_time": sess.end_time.isoformat(timespec="minutes"),
             "location": sess.location,
             "instructor_name": sess.instructor_name,
             "max_participants": sess.max_participants,
@@ -113,7 +155,7 @@ async def list_sessions_for_training(
 
 
 @router.get("/{session_id}")
-async def get_session(
+async def get_training_session(
     session_id: UUID,
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
@@ -133,8 +175,8 @@ async def get_session(
         "id": str(training_session.id),
         "training_id": str(training_session.training_id),
         "session_date": training_session.session_date.isoformat(),
-        "start_time": training_session.start_time,
-        "end_time": training_session.end_time,
+        "start_time": training_session.start_time.isoformat(timespec="minutes"),
+        "end_time": training_session.end_time.isoformat(timespec="minutes"),
         "location": training_session.location,
         "instructor_name": training_session.instructor_name,
         "max_participants": training_session.max_participants,
@@ -153,12 +195,41 @@ async def update_session(
     end_time: str | None = None,
     location: str | None = None,
     instructor_name: str | None = None,
-    max_participants: int | None = None,
+    max_participants: Annotated[int | None, Query(gt=0)] = None,
 ):
     """Update training session details."""
-    result = await session.execute(
-        select(TrainingSession).where(TrainingSession.id == session_id)
-    )
+    values = {}
+    if session_date is not None:
+        values["session_date"] = session_date
+    if start_time is not None:
+        values["start_time"] = _parse_hhmm(start_time)
+    if end_time is not None:
+        values["end_time"] = _parse_hhmm(end_time)
+    if location is not None:
+        values["location"] = location
+    if instructor_name is not None:
+        values["instructor_name"] = instructor_name
+    if max_participants is not None:
+        values["max_participants"] = max_participants
+
+    if values:
+        stmt = (
+            update(TrainingSession)
+            .where(TrainingSession.id == session_id)
+            .values(**values)
+            .returning(TrainingSession)
+        )
+    else:
+        stmt = select(TrainingSession).where(TrainingSession.id == session_id)
+    try:
+        result = await session.execute(stmt)
+    except IntegrityError as exc:
+        if _violated_constraint(exc) != _CAPACITY_CHECK:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="max_participants cannot be below current participants",
+        ) from exc
     training_session = result.scalar_one_or_none()
 
     if not training_session:
@@ -167,38 +238,14 @@ async def update_session(
             detail="Training session not found",
         )
 
-    if session_date is not None:
-        training_session.session_date = session_date
-    if start_time is not None:
-        if len(start_time) != 5:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Time must be in HH:MM format",
-            )
-        training_session.start_time = start_time
-    if end_time is not None:
-        if len(end_time) != 5:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Time must be in HH:MM format",
-            )
-        training_session.end_time = end_time
-    if location is not None:
-        training_session.location = location
-    if instructor_name is not None:
-        training_session.instructor_name = instructor_name
-    if max_participants is not None:
-        training_session.max_participants = max_participants
-
     await session.commit()
-    await session.refresh(training_session)
 
     return {
         "id": str(training_session.id),
         "training_id": str(training_session.training_id),
         "session_date": training_session.session_date.isoformat(),
-        "start_time": training_session.start_time,
-        "end_time": training_session.end_time,
+        "start_time": training_session.start_time.isoformat(timespec="minutes"),
+        "end_time": training_session.end_time.isoformat(timespec="minutes"),
         "location": training_session.location,
         "instructor_name": training_session.instructor_name,
         "max_participants": training_session.max_participants,
@@ -214,15 +261,15 @@ async def delete_session(
 ):
     """Delete a training session."""
     result = await session.execute(
-        select(TrainingSession).where(TrainingSession.id == session_id)
+        delete(TrainingSession)
+        .where(TrainingSession.id == session_id)
+        .returning(TrainingSession.id)
     )
-    training_session = result.scalar_one_or_none()
 
-    if not training_session:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Training session not found",
         )
 
-    await session.delete(training_session)
     await session.commit()
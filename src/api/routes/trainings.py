@@ -1,41 +1,116 @@
 """Training management routes."""
 
-from datetime import datetime
-from typing import Annotated
+from typing import Annotated, NoReturn
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import String, bindparam, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from src.core.db import get_session
-from src.core.notifications import notify_training_approved, notify_training_rejected
+from sqlalchemy.orm import raiseload, selectinload
+
+from src.core.db import get_ro_session, get_session, paginate
+from src.core.notifications import (
+    notify_training_approved,
+    notify_training_approved_bulk,
+    notify_training_rejected,
+)
+from src.models.content import LessonType, Module
 from src.models.training import Training, TrainingStatus
 from src.api.deps.auth import get_current_user
+from src.api.deps.cache import PRIVATE_REVALIDATE, apply_etag, entity_etag
+from src.api.deps.pagination import Cursor, PageLimit, decode_cursor, encode_cursor
 from src.models.user import User, UserRole
 
 router = APIRouter(prefix="/trainings", tags=["trainings"])
 
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 class TrainingCreate(BaseModel):
     title: str
     description: str
     category: str
-    duration_hours: float
-    max_participants: int
+    duration_hours: float = Field(gt=0)
+    max_participants: int = Field(gt=0)
     is_mandatory: bool = False
 
 class TrainingUpdate(BaseModel):
     title: str | None = None
     description: str | None = None
     category: str | None = None
-    duration_hours: float | None = None
-    max_participants: int | None = None
+    duration_hours: float | None = Field(default=None, gt=0)
+    max_participants: int | None = Field(default=None, gt=0)
     is_mandatory: bool | None = None
 
-@router.post("")
+class BulkApproveRequest(BaseModel):
+    training_ids: list[UUID] = Field(min_length=1, max_length=500)
+
+class TrainingRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    title: str
+    description: str
+    category: str
+    duration_hours: float
+    max_participants: int
+    is_mandatory: bool
+    status: TrainingStatus
+    created_by_id: UUID | None = None
+
+class LessonRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    title: str
+    type: LessonType
+    duration_minutes: int
+    content_url: str | None = None
+    content_text: str | None = None
+    questions: list[dict]
+    order: int
+
+class ModuleRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    title: str
+    order: int
+    lessons: list[LessonRead]
+
+class TrainingReadWithModules(TrainingRead):
+    prerequisites: list[str]
+    learning_objectives: list[str]
+    # Using materials_url as image for now
+    image: str | None = Field(default=None, validation_alias="materials_url")
+    modules: list[ModuleRead]
+
+class TrainingListItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    title: str
+    category: str
+    duration_hours: float
+    is_mandatory: bool
+    # Plain string: list_trainings casts status to text in SQL, so there is
+    # no per-row enum conversion to redo here
+    status: str
+
+class TrainingPage(BaseModel):
+    items: list[TrainingListItem]
+    total: int | None
+    next_cursor: str | None
+
+# Built once at import; requests only add their SET clause and bind the id
+_UPDATE_TRAINING = (
+    update(Training)
+    .where(Training.id == bindparam("training_id"))
+    .returning(Training)
+)
+_SELECT_TRAINING = select(Training).where(Training.id == bindparam("training_id"))
+
+@router.post("", response_model=TrainingRead)
 async def create_training(
     training_in: TrainingCreate,
     session: Annotated[AsyncSession, Depends(get_session)],
@@ -49,171 +124,165 @@ async def create_training(
     if current_user.role == UserRole.SUPER_ADMIN:
         status = TrainingStatus.APPROVED
         approved_by_id = current_user.id
-        approved_at = datetime.utcnow()
-
-    training = Training(
-        title=training_in.title,
-        description=training_in.description,
-        category=training_in.category,
-        duration_hours=training_in.duration_hours,
-        max_participants=training_in.max_participants,
-        is_mandatory=training_in.is_mandatory,
-        created_by_id=current_user.id,
-        status=status,
-        approved_by_id=approved_by_id,
-        approved_at=approved_at,
+        approved_at = func.now()
+
+    result = await session.execute(
+        insert(Training)
+        .values(
+            title=training_in.title,
+            description=training_in.description,
+            category=training_in.category,
+            duration_hours=training_in.duration_hours,
+            max_participants=training_in.max_participants,
+            is_mandatory=training_in.is_mandatory,
+            created_by_id=current_user.id,
+            status=status,
+            approved_by_id=approved_by_id,
+            approved_at=approved_at,
+            prerequisites=[],
+            learning_objectives=[],
+        )
+        .returning(Training)
     )
-    session.add(training)
+    training = result.scalar_one()
     await session.commit()
-    await session.refresh(training)
+
+    return training
+
+
+@router.get("/pending")
+async def list_pending_trainings(
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
+    skip: int = 0,
+    limit: PageLimit = 100,
+):
+    """List trainings pending approval (admin only - auth disabled for now)."""
+    query = select(
+        Training.id,
+        Training.title,
+        Training.category,
+        Training.duration_hours,
+        # Plain string from the driver; skips per-row Enum conversion
+        Training.status.cast(String).label("status"),
+        Training.created_at,
+    ).where(Training.status == TrainingStatus.PENDING_APPROVAL)
+    # Offset paging needs a total order, or rows can repeat or go missing
+    query = query.order_by(Training.created_at, Training.id)
+    rows, total = await paginate(session, query, skip, limit)
 
     return {
-        "id": str(training.id),
-        "title": training.title,
-        "description": training.description,
-        "category": training.category,
-        "duration_hours": training.duration_hours,
-        "max_participants": training.max_participants,
-        "is_mandatory": training.is_mandatory,
-        "status": training.status.value,
-        "created_by_id": (
-            str(training.created_by_id) if training.created_by_id else None
-        ),
+        "items": [
+            {
+                "id": t.id,
+                "title": t.title,
+                "category": t.category,
+                "duration_hours": t.duration_hours,
+                "status": t.status,
+                "created_at": t.created_at,
+            }
+            for t in rows
+        ],
+        "total": total,
     }
 
 
-@router.get("/{training_id}")
+@router.get("/{training_id}", response_model=TrainingReadWithModules)
 async def get_training(
     training_id: UUID,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
 ):
     """Get training by ID with modules and lessons."""
-    training = await session.get(Training, training_id)
+    # Modules and all their lessons come from one IN query each
+    query = (
+        select(Training)
+        .where(Training.id == training_id)
+        .options(
+            selectinload(Training.modules).selectinload(Module.lessons),
+            raiseload("*"),
+        )
+    )
+    result = await session.execute(query)
+    training = result.scalar_one_or_none()
     if not training:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Training not found",
         )
 
-    # Fetch modules
-    from src.models.content import Module, Lesson
-    modules_query = select(Module).where(Module.training_id == training_id).order_by(Module.order)
-    result = await session.execute(modules_query)
-    modules = result.scalars().all()
-
-    modules_data = []
-    for module in modules:
-        # Fetch lessons for each module
-        lessons_query = select(Lesson).where(Lesson.module_id == module.id).order_by(Lesson.order)
-        l_result = await session.execute(lessons_query)
-        lessons = l_result.scalars().all()
-        
-        modules_data.append({
-            "id": str(module.id),
-            "title": module.title,
-            "order": module.order,
-            "lessons": [
-                {
-                    "id": str(l.id),
-                    "title": l.title,
-                    "type": l.type.value,
-                    "duration_minutes": l.duration_minutes,
-                    "content_url": l.content_url,
-                    "content_text": l.content_text,
-                    "questions": l.questions,
-                    "order": l.order
-                } for l in lessons
-            ]
-        })
+    # Module/lesson edits don't touch the training row, so version them too
+    markers = [training.id, training.updated_at]
+    for module in training.modules:
+        markers += [module.id, module.updated_at]
+        markers += [(lesson.id, lesson.updated_at) for lesson in module.lessons]
+    apply_etag(request, response, entity_etag(*markers), PRIVATE_REVALIDATE)
 
-    return {
-        "id": str(training.id),
-        "title": training.title,
-        "description": training.description,
-        "category": training.category,
-        "duration_hours": training.duration_hours,
-        "max_participants": training.max_participants,
-        "is_mandatory": training.is_mandatory,
-        "status": training.status.value,
-        "prerequisites": training.prerequisites,
-        "learning_objectives": training.learning_objectives,
-        "created_by_id": str(training.created_by_id) if training.created_by_id else None,
-        "image": training.materials_url, # Using materials_url as image for now
-        "modules": modules_data
-    }
+    return training
 
 
-@router.get("")
+@router.get("", response_model=TrainingPage)
 async def list_trainings(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
+    cursor: Annotated[Cursor | None, Depends(decode_cursor)],
     category: str | None = None,
-    skip: int = 0,
-    limit: int = 100,
+    skip: Annotated[int, Query(deprecated=True)] = 0,
+    limit: PageLimit = 100,
 ):
-    """List all trainings with optional category filter."""
-    query = select(Training)
+    """
+    List trainings, newest first, with optional category filter.
+
+    Pass the previous page's next_cursor as ``after`` to page through
+    results; total is only reported for offset (``skip``) paging.
+    """
+    query = select(
+        Training.id,
+        Training.title,
+        Training.category,
+        Training.duration_hours,
+        Training.is_mandatory,
+        # Plain string from the driver; skips per-row Enum conversion
+        Training.status.cast(String).label("status"),
+        Training.created_at,
+    ).order_by(Training.created_at.desc(), Training.id.desc())
 
     if category:
         query = query.where(Training.category == category)
 
-    result = await session.execute(query.offset(skip).limit(limit))
-    trainings = result.scalars().all()
+    if cursor:
+        query = query.where(tuple_(Training.created_at, Training.id) < cursor)
+        rows, total = (await session.execute(query.limit(limit))).all(), None
+    else:
+        rows, total = await paginate(session, query, skip, limit)
+
+    last = rows[-1] if len(rows) == limit else None
 
     return {
-        "items": [
-            {
-                "id": str(t.id),
-                "title": t.title,
-                "category": t.category,
-                "duration_hours": t.duration_hours,
-                "is_mandatory": t.is_mandatory,
-                "status": t.status.value,
-            }
-            for t in trainings
-        ],
-        "total": len(trainings),
+        "items": rows,
+        "total": total,
+        "next_cursor": encode_cursor(last.created_at, last.id) if last else None,
     }
 
-@router.put("/{training_id}")
+@router.put("/{training_id}", response_model=TrainingRead)
 async def update_training(
     training_id: UUID,
     training_update: TrainingUpdate,
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
     """Update a training."""
-    training = await session.get(Training, training_id)
+    values = training_update.model_dump(exclude_none=True)
+    stmt = _UPDATE_TRAINING.values(**values) if values else _SELECT_TRAINING
+    result = await session.execute(stmt, {"training_id": training_id})
+    training = result.scalar_one_or_none()
     if not training:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Training not found",
         )
 
-    if training_update.title is not None:
-        training.title = training_update.title
-    if training_update.description is not None:
-        training.description = training_update.description
-    if training_update.category is not None:
-        training.category = training_update.category
-    if training_update.duration_hours is not None:
-        training.duration_hours = training_update.duration_hours
-    if training_update.max_participants is not None:
-        training.max_participants = training_update.max_participants
-    if training_update.is_mandatory is not None:
-        training.is_mandatory = training_update.is_mandatory
-
     await session.commit()
-    await session.refresh(training)
 
-    return {
-        "id": str(training.id),
-        "title": training.title,
-        "description": training.description,
-        "category": training.category,
-        "duration_hours": training.duration_hours,
-        "max_participants": training.max_participants,
-        "is_mandatory": training.is_mandatory,
-        "status": training.status.value,
-    }
+    return training
 
 
 @router.delete("/{training_id}")
@@ -234,7 +303,7 @@ async def delete_training(
     await session.delete(training)
     await session.commit()
 
-    return {"message": "Training deleted successfully", "id": str(training_id)}
+    return {"message": "Training deleted successfully", "id": training_id}
 
 
 # Approval workflow endpoints
@@ -259,16 +328,31 @@ async def submit_training_for_approval(
 
     training.status = TrainingStatus.PENDING_APPROVAL
     await session.commit()
-    await session.refresh(training)
 
     return {
-        "id": str(training.id),
+        "id": training.id,
         "title": training.title,
         "status": training.status.value,
         "message": "Training submitted for approval",
     }
 
 
+async def _raise_not_pending(
+    session: AsyncSession, training_id: UUID, action: str
+) -> NoReturn:
+    """Explain why a PENDING_APPROVAL-guarded update matched no row."""
+    found = await session.scalar(select(Training.id).where(Training.id == training_id))
+    if not found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Training not found",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Only PENDING_APPROVAL trainings can be {action}",
+    )
+
+
 @router.put("/{training_id}/approve")
 async def approve_training(
     training_id: UUID,
@@ -277,44 +361,89 @@ async def approve_training(
 ):
     """Approve training (admin/super_admin only)."""
     # TODO: Check role
-    training = await session.get(Training, training_id)
-    if not training:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Training not found",
+    # Status check and transition in one statement
+    result = await session.execute(
+        update(Training)
+        .where(
+            Training.id == training_id,
+            Training.status == TrainingStatus.PENDING_APPROVAL,
         )
-
-    if training.status != TrainingStatus.PENDING_APPROVAL:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only PENDING_APPROVAL trainings can be approved",
+        .values(
+            status=TrainingStatus.APPROVED,
+            approved_by_id=current_user.id,
+            approved_at=func.now(),
+            rejection_reason=None,
         )
-
-    training.status = TrainingStatus.APPROVED
-    training.approved_by_id = current_user.id
-    training.approved_at = datetime.utcnow()
-    training.rejection_reason = None
+        .returning(Training)
+    )
+    training = result.scalar_one_or_none()
+    if not training:
+        await _raise_not_pending(session, training_id, "approved")
 
     # Notify creator about approval
     if training.created_by_id:
-        await notify_training_approved(
-            session=session,
-            user_id=training.created_by_id,
-            training_title=training.title,
+        session.add(
+            notify_training_approved(
+                user_id=training.created_by_id,
+                training_title=training.title,
+            )
         )
 
     await session.commit()
-    await session.refresh(training)
 
     return {
-        "id": str(training.id),
+        "id": training.id,
         "title": training.title,
         "status": training.status.value,
-        "approved_at": training.approved_at.isoformat(),
+        "approved_at": training.approved_at,
         "message": "Training approved successfully",
     }
 
 
+@router.post("/bulk-approve")
+async def bulk_approve_trainings(
+    body: BulkApproveRequest,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    """Approve several pending trainings at once (admin/super_admin only)."""
+    # TODO: Check role
+    result = await session.execute(
+        update(Training)
+        .where(
+            Training.id.in_(body.training_ids),
+            Training.status == TrainingStatus.PENDING_APPROVAL,
+        )
+        .values(
+            status=TrainingStatus.APPROVED,
+            approved_by_id=current_user.id,
+            approved_at=func.now(),
+            rejection_reason=None,
+        )
+        .returning(Training.id, Training.title, Training.created_by_id)
+    )
+    approved = result.all()
+
+    # One multi-row INSERT for all creator notifications
+    await notify_training_approved_bulk(
+        session,
+        [(t.created_by_id, t.title) for t in approved if t.created_by_id],
+    )
+
+    await session.commit()
+
+    approved_ids = {t.id for t in approved}
+    return {
+        "approved": [t.id for t in approved],
+        "skipped": [
+            training_id
+            for training_id in dict.fromkeys(body.training_ids)
+            if training_id not in approved_ids
+        ],
+        "message": f"{len(approved)} training(s) approved",
+    }
+
+
 @router.put("/{training_id}/reject")
 async def reject_training(
     training_id: UUID,
@@ -324,67 +453,40 @@ async def reject_training(
 ):
     """Reject training with reason (admin/super_admin only)."""
     # TODO: Check role
-    training = await session.get(Training, training_id)
-    if not training:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Training not found",
+    result = await session.execute(
+        update(Training)
+        .where(
+            Training.id == training_id,
+            Training.status == TrainingStatus.PENDING_APPROVAL,
         )
-
-    if training.status != TrainingStatus.PENDING_APPROVAL:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only PENDING_APPROVAL trainings can be rejected",
+        .values(
+            status=TrainingStatus.REJECTED,
+            rejection_reason=rejection_reason,
+            approved_by_id=None,
+            approved_at=None,
         )
-
-    training.status = TrainingStatus.REJECTED
-    training.rejection_reason = rejection_reason
-    training.approved_by_id = None
-    training.approved_at = None
+        .returning(Training)
+    )
+    training = result.scalar_one_or_none()
+    if not training:
+        await _raise_not_pending(session, training_id, "rejected")
 
     # Notify creator about rejection
     if training.created_by_id:
-        await notify_training_rejected(
-            session=session,
-            user_id=training.created_by_id,
-            training_title=training.title,
-            reason=rejection_reason,
+        session.add(
+            notify_training_rejected(
+                user_id=training.created_by_id,
+                training_title=training.title,
+                reason=rejection_reason,
+            )
         )
 
     await session.commit()
-    await session.refresh(training)
 
     return {
-        "id": str(training.id),
+        "id": training.id,
         "title": training.title,
         "status": training.status.value,
         "rejection_reason": training.rejection_reason,
         "message": "Training rejected",
     }
-
-
-@router.get("/pending")
-async def list_pending_trainings(
-    session: Annotated[AsyncSession, Depends(get_session)],
-    skip: int = 0,
-    limit: int = 100,
-):
-    """List trainings pending approval (admin only - auth disabled for now)."""
-    query = select(Training).where(Training.status == TrainingStatus.PENDING_APPROVAL)
-    result = await session.execute(query.offset(skip).limit(limit))
-    trainings = result.scalars().all()
-
-    return {
-        "items": [
-            {
-                "id": str(t.id),
-                "title": t.title,
-                "category": t.category,
-                "duration_hours": t.duration_hours,
-                "status": t.status.value,
-                "created_at": t.created_at.isoformat(),
-            }
-            for t in trainings
-        ],
-        "total": len(trainings),
-    }
@@ -3,37 +3,60 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import String, bindparam, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db import get_session
+from src.core.db import get_ro_session, get_session, paginate
 from src.api.deps.auth import get_current_user
-from src.models.user import User
+from src.api.deps.cache import PRIVATE_REVALIDATE, apply_etag, entity_etag
+from src.api.deps.pagination import Cursor, PageLimit, decode_cursor, encode_cursor
+from src.models.user import User, UserRole
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-@router.get("/me")
+class UserListItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    email: str
+    full_name: str
+    # Plain string: list_users casts role to text in SQL, so there is no
+    # per-row enum conversion to redo here
+    role: str
+    is_active: bool
+
+class UserRead(UserListItem):
+    role: UserRole
+    department_id: UUID | None = None
+    manager_id: UUID | None = None
+
+class UserPage(BaseModel):
+    items: list[UserListItem]
+    total: int | None
+    next_cursor: str | None
+
+
+@router.get("/me", response_model=UserRead)
 async def get_current_user_profile(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Get current user profile."""
-    return {
-        "id": str(current_user.id),
-        "email": current_user.email,
-        "full_name": current_user.full_name,
-        "role": current_user.role.value,
-        "is_active": current_user.is_active,
-        "department_id": str(current_user.department_id) if current_user.department_id else None,
-        "manager_id": str(current_user.manager_id) if current_user.manager_id else None,
-    }
+    etag = entity_etag(current_user.id, current_user.updated_at)
+    apply_etag(request, response, etag, PRIVATE_REVALIDATE)
+    return current_user
 
 
-@router.get("/{user_id}")
+@router.get("/{user_id}", response_model=UserRead)
 async def get_user(
     user_id: UUID,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
 ):
     """Get user by ID."""
     user = await session.get(User, user_id)
@@ -43,74 +66,74 @@ async def get_user(
             detail="User not found",
         )
 
-    return {
-        "id": str(user.id),
-        "email": user.email,
-        "full_name": user.full_name,
-        "role": user.role.value,
-        "is_active": user.is_active,
-        "department_id": str(user.department_id) if user.department_id else None,
-        "manager_id": str(user.manager_id) if user.manager_id else None,
-    }
+    etag = entity_etag(user.id, user.updated_at)
+    apply_etag(request, response, etag, PRIVATE_REVALIDATE)
+    return user
 
 
-@router.get("")
+@router.get("", response_model=UserPage)
 async def list_users(
-    session: Annotated[AsyncSession, Depends(get_session)],
-    skip: int = 0,
-    limit: int = 100,
+    session: Annotated[AsyncSession, Depends(get_ro_session)],
+    cursor: Annotated[Cursor | None, Depends(decode_cursor)],
+    skip: Annotated[int, Query(deprecated=True)] = 0,
+    limit: PageLimit = 100,
 ):
-    """List all users with pagination."""
-    result = await session.execute(select(User).offset(skip).limit(limit))
-    users = result.scalars().all()
+    """
+    List users, newest first.
+
+    Pass the previous page's next_cursor as ``after`` to page through
+    results; total is only reported for offset (``skip``) paging.
+    """
+    query = select(
+        User.id,
+        User.email,
+        User.full_name,
+        # Plain string from the driver; skips per-row Enum conversion
+        User.role.cast(String).label("role"),
+        User.is_active,
+        User.created_at,
+    ).order_by(User.created_at.desc(), User.id.desc())
+
+    if cursor:
+        query = query.where(tuple_(User.created_at, User.id) < cursor)
+        rows, total = (await session.execute(query.limit(limit))).all(), None
+    else:
+        rows, total = await paginate(session, query, skip, limit)
+
+    last = rows[-1] if len(rows) == limit else None
 
     return {
-        "items": [
-            {
-                "id": str(u.id),
-                "email": u.email,
-                "full_name": u.full_name,
-                "role": u.role.value,
-                "is_active": u.is_active,
-            }
-            for u in users
-        ],
-        "total": len(users),
+        "items": rows,
+        "total": total,
+        "next_cursor": encode_cursor(last.created_at, last.id) if last else None,
     }
 
 
-from pydantic import BaseModel
-
 class UserUpdate(BaseModel):
     full_name: str | None = None
     email: str | None = None
 
-@router.put("/{user_id}")
+# Built once at import; requests only add their SET clause and bind the id
+_UPDATE_USER = update(User).where(User.id == bindparam("user_id")).returning(User)
+_SELECT_USER = select(User).where(User.id == bindparam("user_id"))
+
+@router.put("/{user_id}", response_model=UserRead)
 async def update_user(
     user_id: UUID,
     user_update: UserUpdate,
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
     """Update user details."""
-    user = await session.get(User, user_id)
+    values = user_update.model_dump(exclude_none=True)
+    stmt = _UPDATE_USER.values(**values) if values else _SELECT_USER
+    result = await session.execute(stmt, {"user_id": user_id})
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    if user_update.full_name is not None:
-        user.full_name = user_update.full_name
-    if user_update.email is not None:
-        user.email = user_update.email
-
     await session.commit()
-    await session.refresh(user)
 
-    return {
-        "id": str(user.id),
-        "email": user.email,
-        "full_name": user.full_name,
-        "role": user.role.value,
-        "is_active": user.is_active,
-    }
+    return user
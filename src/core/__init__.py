@@ -2,13 +2,15 @@
 
 from src.core.app import create_app
 from src.core.config import Settings, get_settings
-from src.core.db import TimestampMixin, get_session, init_db
+from src.core.db import TimestampMixin, get_ro_session, get_session, init_db
 from src.core.errors import AppError
 from src.core.security import (
     create_access_token,
     decode_access_token,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 
 __all__ = [
@@ -17,10 +19,13 @@ __all__ = [
     "Settings",
     "init_db",
     "get_session",
+    "get_ro_session",
     "TimestampMixin",
     "AppError",
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
     "create_access_token",
     "decode_access_token",
 ]
@@ -1,24 +1,80 @@
 """FastAPI application factory and configuration."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-
+from fastapi.responses import ORJSONResponse
+
+from src.api.routes import (
+    attendance,
+    auth,
+    badges,
+    certifications,
+    completions,
+    content,
+    departments,
+    enrollments,
+    manager,
+    notifications,
+    profiles,
+    progress,
+    reports,
+    sessions,
+    trainings,
+    users,
+)
 from src.core.config import get_settings
-from src.core.db import close_db, init_db
+from src.core.db import close_db, init_db, warm_pool
 from src.core.errors import register_error_handlers
 from src.core.scheduler import start_scheduler, stop_scheduler
 
 
+# Built once per process; create_app() only mounts it
+api_router = APIRouter(prefix="/api")
+
+
+@api_router.get("/health", tags=["health"])
+async def health_check():
+    """Health check endpoint."""
+    return {
+        "status": "healthy",
+        "version": get_settings().APP_VERSION,
+    }
+
+
+for _module in (
+    auth,
+    users,
+    profiles,
+    trainings,
+    enrollments,
+    notifications,
+    departments,
+    certifications,
+    sessions,
+    attendance,
+    manager,
+    completions,
+    badges,
+    reports,
+    content,
+    progress,
+):
+    api_router.include_router(_module.router)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Application lifespan manager for startup and shutdown events.
 
     Handles:
-    - Database initialization on startup
+    - Database initialization on startup (tables auto-created in
+      development/test or when AUTO_CREATE_SCHEMA is set)
+    - Connection pool warm-up
     - Background scheduler startup
     - Connection cleanup on shutdown
     - Scheduler shutdown
@@ -30,19 +86,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         Control during application runtime
     """
     # Startup
+    settings = get_settings()
     init_db()
-    
-    # Create tables (hack for dev)
-    from src.core.db import _engine
-    from sqlmodel import SQLModel
-    # Import all models to ensure they are registered
-    import src.models  # noqa
-    
-    async with _engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
-        
+
+    # Create tables outside Alembic for local/test databases only;
+    # production schemas are managed by migrations
+    if settings.AUTO_CREATE_SCHEMA or settings.ENVIRONMENT in ("development", "test"):
+        from src.core.db import _engine
+        from sqlmodel import SQLModel
+        # Import all models to ensure they are registered
+        import src.models  # noqa
+
+        async with _engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
     print("✓ Database initialized")
 
+    # Best effort: a slow or unreachable DB must not hold up boot
+    try:
+        await asyncio.wait_for(
+            warm_pool(settings.DB_POOL_SIZE), timeout=settings.DB_POOL_TIMEOUT
+        )
+        print(f"✓ Connection pool warmed ({settings.DB_POOL_SIZE} connections)")
+    except Exception as exc:
+        print(f"⚠ Connection pool warm-up skipped: {exc!r}")
+
     start_scheduler()
     print("✓ Background scheduler started")
 
@@ -80,6 +148,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware
@@ -87,8 +156,11 @@ def create_app() -> FastAPI:
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Explicit lists let preflight responses be built once and cached
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+        expose_headers=["ETag"],
+        max_age=86400,
     )
 
     # Register error handlers
@@ -107,52 +179,7 @@ def include_routers(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
-
-    # Health check endpoint (inline for now)
-    @app.get("/api/health", tags=["health"])
-    async def health_check():
-        """Health check endpoint."""
-        return {
-            "status": "healthy",
-            "version": get_settings().APP_VERSION,
-        }
-
-    # Domain routers
-    from src.api.routes import (
-        auth,
-        users,
-        profiles,
-        trainings,
-        enrollments,
-        notifications,
-        departments,
-        certifications,
-        sessions,
-        attendance,
-        manager,
-        completions,
-        badges,
-        reports,
-    )
-
-    app.include_router(auth.router, prefix="/api")
-    app.include_router(users.router, prefix="/api")
-    app.include_router(profiles.router, prefix="/api")
-    app.include_router(trainings.router, prefix="/api")
-    app.include_router(enrollments.router, prefix="/api")
-    app.include_router(notifications.router, prefix="/api")
-    app.include_router(departments.router, prefix="/api")
-    app.include_router(certifications.router, prefix="/api")
-    app.include_router(sessions.router, prefix="/api")
-    app.include_router(attendance.router, prefix="/api")
-    app.include_router(manager.router, prefix="/api")
-    app.include_router(completions.router, prefix="/api")
-    app.include_router(badges.router, prefix="/api")
-    app.include_router(reports.router, prefix="/api")
-    
-    from src.api.routes import content, progress
-    app.include_router(content.router, prefix="/api")
-    app.include_router(progress.router, prefix="/api")
+    app.include_router(api_router)
 
 
 # Create app instance
@@ -1,7 +1,7 @@
 """Core configuration module - loads settings from environment variables."""
 
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,12 +26,27 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = Field(..., description="PostgreSQL connection string")
     DATABASE_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_USE_LIFO: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_QUERY_CACHE_SIZE: int = 1200
+    AUTO_CREATE_SCHEMA: bool = False  # create_all at startup outside dev/test
 
     # Security / JWT
     JWT_SECRET_KEY: str = Field(..., description="Secret key for JWT signing")
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Password hashing
+    PASSWORD_HASHER: Literal["bcrypt", "argon2"] = "bcrypt"  # argon2 needs argon2-cffi
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+
+    # Notifications
+    NOTIFICATION_RETENTION_DAYS: int = Field(default=90, ge=1)  # read rows only
+
     # CORS
     CORS_ORIGINS: list[str] = Field(
         default_factory=lambda: ["http://localhost:3000"],
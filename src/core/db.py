@@ -1,50 +1,163 @@
 """Database configuration and session management."""
 
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Optional, Sequence
+from uuid import UUID
 
-from sqlalchemy import DateTime, func
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import (
+    DateTime,
+    Row,
+    Select,
+    SmallInteger,
+    TypeDecorator,
+    func,
+    make_url,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel import Field, SQLModel
 
 from src.core.config import get_settings
 
 
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land at the tail of their B-tree index instead of on random pages.
+
+    Returns:
+        UUID with version 7 and the RFC 4122 variant
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    return UUID(
+        int=(unix_ms << 80)
+        | (0x7 << 76)
+        | ((rand >> 62) & 0xFFF) << 64
+        | (0b10 << 62)
+        | (rand & ((1 << 62) - 1))
+    )
+
+
+class BasisPoints(TypeDecorator[float]):
+    """
+    A 0-100 percentage stored as SMALLINT hundredths (basis points).
+
+    Python sees a float with two decimals; the column is 2 bytes instead of
+    an 8-byte double.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: float | None, dialect: Any) -> int | None:
+        return None if value is None else round(value * 100)
+
+    def process_result_value(self, value: int | None, dialect: Any) -> float | None:
+        return None if value is None else value / 100
+
+
 class TimestampMixin:
-    """Mixin for automatic created_at and updated_at timestamps."""
+    """
+    Mixin for automatic created_at and updated_at timestamps.
 
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column_kwargs={"server_default": func.now()},
+    The database assigns both columns, so inserts don't carry them. They are
+    None on an unsaved instance; eager_defaults reads them back with
+    RETURNING at flush, so a flushed instance has them without a refresh.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column_kwargs={"server_default": func.now(), "nullable": False},
     )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column_kwargs={
+            "server_default": func.now(),
+            "onupdate": func.now(),
+            "nullable": False,
+        },
     )
 
 
-def get_engine(database_url: str, echo: bool = False) -> AsyncEngine:
+def get_engine(
+    database_url: str,
+    echo: bool = False,
+    *,
+    pool_size: int = 20,
+    max_overflow: int = 40,
+    pool_recycle: int = 1800,
+    pool_timeout: int = 30,
+    pool_use_lifo: bool = True,
+    statement_cache_size: int = 1024,
+    query_cache_size: int = 1200,
+) -> AsyncEngine:
     """
     Create async SQLAlchemy engine.
 
+    Plain ``postgresql://`` URLs are switched to the asyncpg driver.
+
     Args:
-        database_url: PostgreSQL connection string (asyncpg driver)
+        database_url: PostgreSQL connection string
         echo: Enable SQL query logging
+        pool_size: Persistent connections kept in the pool
+        max_overflow: Extra connections allowed above pool_size
+        pool_recycle: Seconds before a pooled connection is replaced
+        pool_timeout: Seconds to wait for a free connection
+        pool_use_lifo: Hand out the most recently used connection first, so
+            surplus connections sit idle long enough to be recycled
+        statement_cache_size: Prepared statements cached per connection
+        query_cache_size: SQL compilations cached by SQLAlchemy, engine-wide
 
     Returns:
         Configured AsyncEngine instance
     """
+    url = make_url(database_url)
+    if url.drivername in ("postgresql", "postgres"):
+        url = url.set(drivername="postgresql+asyncpg")
+
+    connect_args: dict[str, Any] = {}
+    if url.drivername == "postgresql+asyncpg":
+        # Cache prepared statements per connection so repeated parameterized
+        # queries skip the parse/plan round-trip after their first execution.
+        # JIT only pays off for long analytic queries; for short OLTP ones its
+        # compile step is pure added latency. Timestamps are stored as naive
+        # UTC, so pin the session time zone that now() is converted with.
+        connect_args = {
+            "statement_cache_size": statement_cache_size,
+            "prepared_statement_cache_size": statement_cache_size,
+            "server_settings": {"jit": "off", "timezone": "UTC"},
+        }
+
     return create_async_engine(
-        database_url,
+        url,
         echo=echo,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_timeout=pool_timeout,
+        pool_use_lifo=pool_use_lifo,
+        query_cache_size=query_cache_size,
+        connect_args=connect_args,
     )
 
 
-def get_sessionmaker(engine: AsyncEngine) -> sessionmaker:
+def get_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     """
     Create async session factory.
 
@@ -52,28 +165,62 @@ def get_sessionmaker(engine: AsyncEngine) -> sessionmaker:
         engine: AsyncEngine instance
 
     Returns:
-        Configured sessionmaker for AsyncSession
+        Configured async_sessionmaker
     """
-    return sessionmaker(
+    return async_sessionmaker(
         bind=engine,
-        class_=AsyncSession,
         expire_on_commit=False,
         autoflush=False,
-        autocommit=False,
     )
 
 
-# Global engine and sessionmaker (initialized in app lifespan)
+# Global engine and sessionmakers (initialized in app lifespan)
 _engine: AsyncEngine | None = None
-_sessionmaker: sessionmaker | None = None
+_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+_ro_sessionmaker: async_sessionmaker[AsyncSession] | None = None
 
 
 def init_db() -> None:
-    """Initialize global database engine and sessionmaker from settings."""
-    global _engine, _sessionmaker
+    """Initialize global database engine and sessionmakers from settings."""
+    global _engine, _sessionmaker, _ro_sessionmaker
     settings = get_settings()
-    _engine = get_engine(settings.DATABASE_URL, settings.DATABASE_ECHO)
+    _engine = get_engine(
+        settings.DATABASE_URL,
+        settings.DATABASE_ECHO,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    )
     _sessionmaker = get_sessionmaker(_engine)
+    # Same pool; statements run in autocommit so reads skip BEGIN/COMMIT
+    _ro_sessionmaker = get_sessionmaker(
+        _engine.execution_options(isolation_level="AUTOCOMMIT")
+    )
+
+
+async def warm_pool(size: int) -> None:
+    """
+    Open pooled connections up front so early requests skip the handshake.
+
+    All connections are held at once (not opened one after another) so the
+    pool really ends up with ``size`` live connections.
+
+    Args:
+        size: Number of connections to open, normally the pool size
+    """
+    if not _engine:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+
+    conns = [_engine.connect() for _ in range(size)]
+    try:
+        await asyncio.gather(*(conn.start() for conn in conns))
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in conns), return_exceptions=True)
 
 
 async def close_db() -> None:
@@ -109,6 +256,81 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """
+    Provide a session from the shared pool outside a request.
+
+    For background jobs; unlike get_session it does not commit, so the
+    caller commits its own unit of work.
+
+    Yields:
+        AsyncSession instance
+    """
+    if not _sessionmaker:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+
+    async with _sessionmaker() as session:
+        yield session
+
+
+async def get_ro_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency: provide a session for read-only endpoints.
+
+    Runs in autocommit mode and never commits, so a GET costs only its
+    own queries, with no BEGIN/COMMIT round-trips. Anything added to this
+    session is discarded.
+
+    Yields:
+        AsyncSession instance
+    """
+    if not _ro_sessionmaker:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+
+    async with _ro_sessionmaker() as session:
+        yield session
+
+
+async def paginate(
+    session: AsyncSession,
+    query: Select,
+    skip: int,
+    limit: int,
+) -> tuple[Sequence[Row[Any]], int]:
+    """
+    Fetch one page of a query together with the size of the full result.
+
+    The total is computed by Postgres as ``count(*) OVER ()`` in the same
+    statement, so a page costs a single round-trip. Only a page past the
+    end (which carries no rows to read the total from) falls back to a
+    separate COUNT.
+
+    Args:
+        session: Database session
+        query: SELECT with filters applied, without offset/limit
+        skip: Number of rows to skip
+        limit: Maximum rows to return
+
+    Returns:
+        Tuple of (rows, total); rows keep the query's own columns
+    """
+    rows = (
+        await session.execute(
+            query.add_columns(func.count().over().label("_total"))
+            .offset(skip)
+            .limit(limit)
+        )
+    ).all()
+    if rows:
+        return rows, rows[0]._total
+    if skip == 0:
+        return rows, 0
+
+    total = await session.scalar(select(func.count()).select_from(query.subquery()))
+    return rows, total or 0
+
+
 def get_db_metadata():
     """
     Export SQLModel metadata for Alembic migrations.
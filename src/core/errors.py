@@ -1,10 +1,12 @@
 """Custom application errors and exception handlers."""
 
+from functools import lru_cache
 from typing import Any
 
-from fastapi import HTTPException, Request, status
+import orjson
+from fastapi import HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 
 class AppError(Exception):
@@ -32,7 +34,22 @@ class AppError(Exception):
         super().__init__(message)
 
 
-async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
+class NotModifiedError(Exception):
+    """
+    Raised when a conditional GET matches the current representation.
+
+    Attributes:
+        etag: Current entity tag, echoed on the 304 response
+        cache_control: Cache-Control value to repeat on the 304, if any
+    """
+
+    def __init__(self, etag: str, cache_control: str | None = None):
+        self.etag = etag
+        self.cache_control = cache_control
+        super().__init__(etag)
+
+
+async def app_error_handler(request: Request, exc: AppError) -> ORJSONResponse:
     """
     Convert AppError to structured JSON error response.
 
@@ -41,9 +58,9 @@ async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
         exc: AppError instance
 
     Returns:
-        JSONResponse with error_response schema
+        ORJSONResponse with error_response schema
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "code": exc.code,
@@ -56,7 +73,7 @@ async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
 async def validation_error_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle Pydantic validation errors (422) with structured format.
 
@@ -65,19 +82,17 @@ async def validation_error_handler(
         exc: RequestValidationError from Pydantic
 
     Returns:
-        JSONResponse with validation error details
+        ORJSONResponse with validation error details
     """
     errors: dict[str, list[str]] = {}
 
     for error in exc.errors():
-        field = ".".join(str(loc) for loc in error["loc"] if loc != "body")
-        message = error["msg"]
-
-        if field not in errors:
-            errors[field] = []
-        errors[field].append(message)
+        field = ".".join(
+            [loc if isinstance(loc, str) else str(loc) for loc in error["loc"] if loc != "body"]
+        )
+        errors.setdefault(field, []).append(error["msg"])
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "code": "VALIDATION_ERROR",
@@ -87,7 +102,15 @@ async def validation_error_handler(
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+@lru_cache(maxsize=256)
+def _http_error_body(status_code: int, detail: str) -> bytes:
+    """Serialized HTTPException body, cached since most details are fixed strings."""
+    return orjson.dumps(
+        {"code": f"HTTP_{status_code}", "message": detail, "details": {}}
+    )
+
+
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """
     Handle FastAPI HTTPException with structured format.
 
@@ -96,18 +119,44 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         exc: HTTPException instance
 
     Returns:
-        JSONResponse with error_response schema
+        Response with error_response schema
     """
-    return JSONResponse(
+    if isinstance(exc.detail, str):
+        return Response(
+            content=_http_error_body(exc.status_code, exc.detail),
+            status_code=exc.status_code,
+            media_type="application/json",
+            headers=exc.headers,
+        )
+
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "code": f"HTTP_{exc.status_code}",
             "message": exc.detail,
             "details": {},
         },
+        headers=exc.headers,
     )
 
 
+async def not_modified_handler(request: Request, exc: NotModifiedError) -> Response:
+    """
+    Convert NotModifiedError to an empty 304 response.
+
+    Args:
+        request: FastAPI request object
+        exc: NotModifiedError instance
+
+    Returns:
+        Response with status 304 and the current ETag
+    """
+    headers = {"ETag": exc.etag}
+    if exc.cache_control:
+        headers["Cache-Control"] = exc.cache_control
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
 def register_error_handlers(app: Any) -> None:
     """
     Register all custom exception handlers on FastAPI app.
@@ -118,3 +167,4 @@ def register_error_handlers(app: Any) -> None:
     app.add_exception_handler(AppError, app_error_handler)
     app.add_exception_handler(RequestValidationError, validation_error_handler)
     app.add_exception_handler(HTTPException, http_exception_handler)
+    app.add_exception_handler(NotModifiedError, not_modified_handler)
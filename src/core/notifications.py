@@ -1,14 +1,28 @@
-"""Notification service for creating notifications."""
+"""Notification service for building notifications."""
 
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.badge import BadgeType
 from src.models.notification import Notification, NotificationType
 
+# Above this many rows COPY beats a multi-row INSERT
+COPY_THRESHOLD = 100
 
-async def create_notification(
-    session: AsyncSession,
+# Columns the database fills itself (the timestamps) are left out of writes
+_NOTIFICATION_COLUMNS = [
+    column.name
+    for column in Notification.__table__.columns
+    if column.server_default is None
+]
+
+# Badge titles depend only on the tier, so build them once
+_BADGE_TITLES = {tier.value: f"🎉 {tier.value} Badge Earned!" for tier in BadgeType}
+
+
+def build_notification(
     user_id: UUID,
     notification_type: NotificationType,
     title: str,
@@ -16,10 +30,12 @@ async def create_notification(
     action_url: str | None = None,
 ) -> Notification:
     """
-    Create a notification for a user.
+    Build an unsaved notification for a user.
+
+    Callers add it to their session next to the change that triggered it,
+    so both are written by the same flush and commit.
 
     Args:
-        session: Database session
         user_id: User to notify
         notification_type: Type of notification
         title: Notification title
@@ -27,29 +43,24 @@ async def create_notification(
         action_url: Optional URL for action button
 
     Returns:
-        Created notification
+        Notification instance, not yet added to any session
     """
-    notification = Notification(
+    return Notification(
         user_id=user_id,
         notification_type=notification_type,
         title=title,
         message=message,
         action_url=action_url,
     )
-    session.add(notification)
-    await session.flush()  # Flush to get the ID but don't commit
-    return notification
 
 
-async def notify_training_assigned(
-    session: AsyncSession,
+def notify_training_assigned(
     user_id: UUID,
     training_title: str,
     assigned_by_name: str = "Manager",
 ) -> Notification:
-    """Notify user about training assignment."""
-    return await create_notification(
-        session=session,
+    """Build the notification for training assignment."""
+    return build_notification(
         user_id=user_id,
         notification_type=NotificationType.TRAINING_ASSIGNED,
         title="New Training Assigned",
@@ -58,14 +69,12 @@ async def notify_training_assigned(
     )
 
 
-async def notify_training_approved(
-    session: AsyncSession,
+def notify_training_approved(
     user_id: UUID,
     training_title: str,
 ) -> Notification:
-    """Notify user about training approval."""
-    return await create_notification(
-        session=session,
+    """Build the notification for training approval."""
+    return build_notification(
         user_id=user_id,
         notification_type=NotificationType.TRAINING_APPROVED,
         title="Training Approved",
@@ -74,15 +83,93 @@ async def notify_training_approved(
     )
 
 
-async def notify_training_rejected(
+async def create_notifications_bulk(
+    session: AsyncSession,
+    notifications: list[Notification],
+) -> None:
+    """
+    Write many built notifications in one statement.
+
+    Large batches on asyncpg are streamed with COPY on the session's own
+    connection, so they still commit or roll back with the session.
+    Smaller batches, and other drivers, use a multi-row INSERT.
+
+    Args:
+        session: Database session
+        notifications: Unsaved notifications from the notify_* builders
+    """
+    if not notifications:
+        return
+
+    fields = set(_NOTIFICATION_COLUMNS)
+    rows = [notification.model_dump(include=fields) for notification in notifications]
+
+    connection = await session.connection()
+    if len(rows) > COPY_THRESHOLD and connection.dialect.driver == "asyncpg":
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            Notification.__tablename__,
+            records=[
+                tuple(row[column] for column in _NOTIFICATION_COLUMNS) for row in rows
+            ],
+            columns=_NOTIFICATION_COLUMNS,
+        )
+        return
+
+    await session.execute(insert(Notification), rows)
+
+
+async def notify_training_assigned_bulk(
+    session: AsyncSession,
+    user_ids: list[UUID],
+    training_title: str,
+    assigned_by_name: str = "Manager",
+) -> None:
+    """
+    Write assignment notifications for many users in one statement.
+
+    Args:
+        session: Database session
+        user_ids: Users the training was assigned to
+        training_title: Title of the assigned training
+        assigned_by_name: Name shown as the assigner
+    """
+    await create_notifications_bulk(
+        session,
+        [
+            notify_training_assigned(user_id, training_title, assigned_by_name)
+            for user_id in user_ids
+        ],
+    )
+
+
+async def notify_training_approved_bulk(
     session: AsyncSession,
+    items: list[tuple[UUID, str]],
+) -> None:
+    """
+    Write approval notifications for many trainings in one statement.
+
+    Args:
+        session: Database session
+        items: (creator user_id, training title) pairs
+    """
+    await create_notifications_bulk(
+        session,
+        [
+            notify_training_approved(user_id, training_title)
+            for user_id, training_title in items
+        ],
+    )
+
+
+def notify_training_rejected(
     user_id: UUID,
     training_title: str,
     reason: str,
 ) -> Notification:
-    """Notify user about training rejection."""
-    return await create_notification(
-        session=session,
+    """Build the notification for training rejection."""
+    return build_notification(
         user_id=user_id,
         notification_type=NotificationType.TRAINING_REJECTED,
         title="Training Rejected",
@@ -91,34 +178,30 @@ async def notify_training_rejected(
     )
 
 
-async def notify_badge_earned(
-    session: AsyncSession,
+def notify_badge_earned(
     user_id: UUID,
     badge_type: str,
     year: int,
     hours: float,
 ) -> Notification:
-    """Notify user about earning a badge."""
-    return await create_notification(
-        session=session,
+    """Build the notification for earning a badge."""
+    return build_notification(
         user_id=user_id,
         notification_type=NotificationType.BADGE_EARNED,
-        title=f"🎉 {badge_type} Badge Earned!",
+        title=_BADGE_TITLES.get(badge_type) or f"🎉 {badge_type} Badge Earned!",
         message=f"Congratulations! You've earned a {badge_type} badge for completing {hours} learning hours in {year}!",
         action_url="/badges",
     )
 
 
-async def notify_session_reminder(
-    session: AsyncSession,
+def notify_session_reminder(
     user_id: UUID,
     training_title: str,
     session_date: str,
     session_time: str,
 ) -> Notification:
-    """Notify user about upcoming training session."""
-    return await create_notification(
-        session=session,
+    """Build the notification for upcoming training session."""
+    return build_notification(
         user_id=user_id,
         notification_type=NotificationType.SESSION_REMINDER,
         title="Upcoming Training Session",
@@ -127,14 +210,12 @@ async def notify_session_reminder(
     )
 
 
-async def notify_enrollment_confirmed(
-    session: AsyncSession,
+def notify_enrollment_confirmed(
     user_id: UUID,
     training_title: str,
 ) -> Notification:
-    """Notify user about enrollment confirmation."""
-    return await create_notification(
-        session=session,
+    """Build the notification for enrollment confirmation."""
+    return build_notification(
         user_id=user_id,
         notification_type=NotificationType.SESSION_SCHEDULED,
         title="Enrollment Confirmed",
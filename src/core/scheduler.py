@@ -1,18 +1,19 @@
 """Background scheduler for periodic tasks."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.core.config import get_settings
-from src.core.notifications import notify_session_reminder
+from src.core.db import session_scope
+from src.core.notifications import create_notifications_bulk, notify_session_reminder
 from src.models.enrollment import Enrollment
-from src.models.training import TrainingSession
+from src.models.notification import Notification
+from src.models.training import Training, TrainingSession
 from src.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -29,63 +30,51 @@ async def send_session_reminders():
     logger.info("Running session reminders task")
 
     try:
-        settings = get_settings()
-        engine = create_async_engine(settings.DATABASE_URL, echo=False)
-        async_session = sessionmaker(
-            engine, class_=AsyncSession, expire_on_commit=False
-        )
-
-        async with async_session() as session:
+        async with session_scope() as session:
             # Get tomorrow's date
-            tomorrow = (datetime.utcnow() + timedelta(days=1)).date()
-
-            # Find all sessions scheduled for tomorrow
-            sessions_query = select(TrainingSession).where(
-                TrainingSession.session_date == tomorrow
+            tomorrow = (datetime.now(timezone.utc) + timedelta(days=1)).date()
+
+            # One round-trip: every (session, enrolled user) pair for tomorrow
+            reminders_query = (
+                select(
+                    TrainingSession.id,
+                    TrainingSession.session_date,
+                    TrainingSession.start_time,
+                    Training.title,
+                    Enrollment.user_id,
+                )
+                .join(Training, Training.id == TrainingSession.training_id)
+                .join(Enrollment, Enrollment.training_id == Training.id)
+                .where(TrainingSession.session_date == tomorrow)
             )
-            result = await session.execute(sessions_query)
-            upcoming_sessions = result.scalars().all()
+            result = await session.execute(reminders_query)
+            reminders = result.all()
 
             logger.info(
-                f"Found {len(upcoming_sessions)} sessions scheduled for {tomorrow}"
+                f"Found {len({r.id for r in reminders})} sessions with enrollments "
+                f"scheduled for {tomorrow}"
             )
 
-            # For each session, find enrolled users and send reminders
-            for training_session in upcoming_sessions:
-                # Get all enrollments for this training
-                enrollments_query = select(Enrollment).where(
-                    Enrollment.training_id == training_session.training_id
-                )
-                enrollments_result = await session.execute(enrollments_query)
-                enrollments = enrollments_result.scalars().all()
-
-                # Get training details
-                from src.models.training import Training
-
-                training = await session.get(Training, training_session.training_id)
-
-                if not training:
-                    continue
-
-                # Send notification to each enrolled user
-                for enrollment in enrollments:
-                    try:
-                        await notify_session_reminder(
-                            session=session,
-                            user_id=enrollment.user_id,
-                            training_title=training.title,
-                            session_date=str(training_session.session_date),
-                            session_time=training_session.start_time,
-                        )
-                        logger.info(
-                            f"Sent reminder to user {enrollment.user_id} for session {training_session.id}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to send reminder to user {enrollment.user_id}: {e}"
+            # Build a notification for each enrolled user, then write them at once
+            notifications = []
+            for reminder in reminders:
+                try:
+                    notifications.append(
+                        notify_session_reminder(
+                            user_id=reminder.user_id,
+                            training_title=reminder.title,
+                            session_date=str(reminder.session_date),
+                            session_time=reminder.start_time.isoformat(timespec="minutes"),
                         )
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to build reminder for user {reminder.user_id}: {e}"
+                    )
 
+            await create_notifications_bulk(session, notifications)
             await session.commit()
+            logger.info(f"Sent {len(notifications)} session reminders")
             logger.info("Session reminders task completed successfully")
 
     except Exception as e:
@@ -100,95 +89,88 @@ async def calculate_yearly_badges():
     logger.info("Running yearly badge calculation task")
 
     try:
-        settings = get_settings()
-        engine = create_async_engine(settings.DATABASE_URL, echo=False)
-        async_session = sessionmaker(
-            engine, class_=AsyncSession, expire_on_commit=False
-        )
-
-        async with async_session() as session:
+        async with session_scope() as session:
             from src.models.completion import TrainingCompletion
-            from src.models.badge import Badge
+            from src.models.badge import BADGE_TIER_HOURS, Badge, badge_type_for_hours
+            from src.core.notifications import notify_badge_earned
 
             # Get previous year
-            current_year = datetime.utcnow().year
+            now = datetime.now(timezone.utc)
+            current_year = now.year
             previous_year = current_year - 1
 
-            logger.info(f"Calculating badges for year {previous_year}")
+            # completed_at is stored as naive UTC, so the bounds are naive too
+            year_start = datetime(previous_year, 1, 1)
+            year_end = datetime(current_year, 1, 1)
 
-            # Get all users who completed trainings last year
-            completions_query = select(TrainingCompletion).where(
-                TrainingCompletion.completed_at >= datetime(previous_year, 1, 1),
-                TrainingCompletion.completed_at < datetime(current_year, 1, 1),
-            )
-            result = await session.execute(completions_query)
-            completions = result.scalars().all()
-
-            # Group by user and calculate total hours
-            user_hours = {}
-            user_trainings = {}
-            for completion in completions:
-                user_id = completion.user_id
-                if user_id not in user_hours:
-                    user_hours[user_id] = 0
-                    user_trainings[user_id] = 0
-                user_hours[user_id] += completion.learning_hours
-                user_trainings[user_id] += 1
+            logger.info(f"Calculating badges for year {previous_year}")
 
-            logger.info(
-                f"Found {len(user_hours)} users with completions in {previous_year}"
+            # Total hours and trainings per user, for users who reached at
+            # least the lowest tier last year
+            hours = func.sum(TrainingCompletion.learning_hours)
+            totals_query = (
+                select(
+                    TrainingCompletion.user_id,
+                    hours.label("hours"),
+                    func.count().label("trainings"),
+                )
+                .where(
+                    TrainingCompletion.completed_at >= year_start,
+                    TrainingCompletion.completed_at < year_end,
+                )
+                .group_by(TrainingCompletion.user_id)
+                .having(hours >= BADGE_TIER_HOURS[0])
             )
 
-            # Award badges
-            from src.models.badge import BadgeType
-            from src.core.notifications import notify_badge_earned
-
-            for user_id, total_hours in user_hours.items():
-                # Check if user already has badge for this year
-                existing_badge_query = select(Badge).where(
-                    Badge.user_id == user_id,
-                    Badge.year_earned == previous_year,
-                )
-                existing_result = await session.execute(existing_badge_query)
-                if existing_result.scalar_one_or_none():
-                    logger.info(f"User {user_id} already has badge for {previous_year}")
-                    continue
-
-                # Determine badge type
-                badge_type = None
-                if total_hours >= 80:
-                    badge_type = BadgeType.PLATINUM
-                elif total_hours >= 60:
-                    badge_type = BadgeType.GOLD
-                elif total_hours >= 40:
-                    badge_type = BadgeType.SILVER
-                elif total_hours >= 20:
-                    badge_type = BadgeType.BRONZE
-
-                if badge_type:
-                    # Create badge
-                    badge = Badge(
+            # Stream the totals and build badge rows as they arrive
+            awarded_at = now.isoformat()
+            badges = []
+            result = await session.stream(totals_query)
+            async for user_id, total_hours, total_trainings in result:
+                badges.append(
+                    Badge(
                         user_id=user_id,
-                        badge_type=badge_type,
+                        badge_type=badge_type_for_hours(total_hours),
                         year_earned=previous_year,
                         hours_completed=total_hours,
-                        trainings_completed=user_trainings[user_id],
-                        awarded_at=datetime.utcnow().isoformat(),
-                    )
-                    session.add(badge)
+                        trainings_completed=total_trainings,
+                        awarded_at=awarded_at,
+                    ).model_dump(exclude={"created_at", "updated_at"})
+                )
 
-                    # Send notification
-                    await notify_badge_earned(
-                        session=session,
+            logger.info(f"Found {len(badges)} users eligible for a badge in {previous_year}")
+
+            # One statement; users who already hold a badge for the year are
+            # skipped by the unique constraint and left out of RETURNING
+            awarded = []
+            if badges:
+                result = await session.execute(
+                    pg_insert(Badge)
+                    .on_conflict_do_nothing(index_elements=["user_id", "year_earned"])
+                    .returning(Badge.user_id, Badge.badge_type, Badge.hours_completed),
+                    badges,
+                )
+                awarded = result.all()
+
+            notifications = []
+            for user_id, badge_type, total_hours in awarded:
+                notifications.append(
+                    notify_badge_earned(
                         user_id=user_id,
                         badge_type=badge_type.value,
                         year=previous_year,
                         hours=total_hours,
                     )
-                    logger.info(
-                        f"Awarded {badge_type.value} badge to user {user_id} for {previous_year}"
-                    )
+                )
+                logger.info(
+                    f"Awarded {badge_type.value} badge to user {user_id} for {previous_year}"
+                )
 
+            logger.info(
+                f"{len(badges) - len(awarded)} users already had a badge for {previous_year}"
+            )
+
+            await create_notifications_bulk(session, notifications)
             await session.commit()
             logger.info("Yearly badge calculation completed successfully")
 
@@ -196,6 +178,36 @@ async def calculate_yearly_badges():
         logger.error(f"Error in calculate_yearly_badges: {e}")
 
 
+async def purge_read_notifications():
+    """
+    Delete read notifications older than the retention window.
+    Runs daily so each pass only removes about one day's worth of rows.
+    """
+    logger.info("Running notification cleanup task")
+
+    try:
+        retention_days = get_settings().NOTIFICATION_RETENTION_DAYS
+        # created_at is stored as naive UTC
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            days=retention_days
+        )
+
+        async with session_scope() as session:
+            result = await session.execute(
+                delete(Notification).where(
+                    Notification.is_read == True,
+                    Notification.created_at < cutoff,
+                )
+            )
+            await session.commit()
+            logger.info(
+                f"Deleted {result.rowcount} read notifications older than {retention_days} days"
+            )
+
+    except Exception as e:
+        logger.error(f"Error in purge_read_notifications: {e}")
+
+
 def start_scheduler():
     """Start the background scheduler."""
     global scheduler
@@ -204,7 +216,11 @@ def start_scheduler():
         logger.warning("Scheduler already running")
         return
 
-    scheduler = AsyncIOScheduler()
+    # Never run a job twice at once; runs missed while one overran (or while
+    # the app was down, within the grace period) collapse into a single run
+    scheduler = AsyncIOScheduler(
+        job_defaults={"max_instances": 1, "coalesce": True, "misfire_grace_time": 3600}
+    )
 
     # Daily job for session reminders (runs at 9 AM every day)
     scheduler.add_job(
@@ -215,6 +231,15 @@ def start_scheduler():
         replace_existing=True,
     )
 
+    # Daily job for notification cleanup (runs at 3 AM every day)
+    scheduler.add_job(
+        purge_read_notifications,
+        CronTrigger(hour=3, minute=0),
+        id="notification_cleanup",
+        name="Purge old read notifications",
+        replace_existing=True,
+    )
+
     # Yearly job for badge calculations (runs on January 1st at midnight)
     scheduler.add_job(
         calculate_yearly_badges,
@@ -1,17 +1,72 @@
 """Security utilities for password hashing and JWT token management."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
 
 from src.core.config import get_settings
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # optional: pip install "lms-hack[argon2]"
+    PasswordHasher = None
+
+# Argon2id with the OWASP-recommended minimum cost; verification reads the
+# parameters from the stored hash, so tuning these never breaks old hashes
+_argon2 = (
+    PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+    if PasswordHasher is not None
+    else None
+)
+
+# JWT settings, read from config once on first use
+_jwt_secret_key: str | None = None
+_jwt_algorithm: str | None = None
+_access_token_expire: timedelta | None = None
+
+
+def _load_jwt_settings() -> None:
+    """Cache the JWT settings used on every token encode/decode."""
+    global _jwt_secret_key, _jwt_algorithm, _access_token_expire
+
+    settings = get_settings()
+    _jwt_secret_key = settings.JWT_SECRET_KEY
+    _jwt_algorithm = settings.JWT_ALGORITHM
+    _access_token_expire = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+
+# Password hashing settings, read from config once on first use
+_bcrypt_rounds: int | None = None
+_use_argon2 = False
+
+
+def _load_password_settings() -> None:
+    """Cache the password hashing settings."""
+    global _bcrypt_rounds, _use_argon2
+
+    settings = get_settings()
+    if settings.PASSWORD_HASHER == "argon2" and _argon2 is None:
+        raise RuntimeError("PASSWORD_HASHER=argon2 requires the argon2-cffi package")
+
+    _bcrypt_rounds = settings.BCRYPT_ROUNDS
+    _use_argon2 = settings.PASSWORD_HASHER == "argon2"
+
+
+def _bcrypt_password(plain_password: str) -> bytes:
+    """Encode a password for bcrypt, truncated to its 72-byte input limit."""
+    # Slicing bytes that already fit returns the same object, no copy
+    return plain_password.encode("utf-8")[:72]
+
 
 def hash_password(plain_password: str) -> str:
     """
-    Hash plaintext password using bcrypt.
+    Hash plaintext password with the configured hasher (bcrypt or argon2id).
 
     Args:
         plain_password: Plaintext password to hash
@@ -19,13 +74,14 @@ def hash_password(plain_password: str) -> str:
     Returns:
         Hashed password string
     """
-    # Bcrypt has a 72-byte limit, truncate if necessary
-    password_bytes = plain_password.encode("utf-8")
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
+    if _bcrypt_rounds is None:
+        _load_password_settings()
 
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    if _use_argon2:
+        return _argon2.hash(plain_password)
+
+    salt = bcrypt.gensalt(rounds=_bcrypt_rounds)
+    hashed = bcrypt.hashpw(_bcrypt_password(plain_password), salt)
     return hashed.decode("utf-8")
 
 
@@ -33,6 +89,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify plaintext password against hashed password.
 
+    Either hash format is accepted, so switching PASSWORD_HASHER keeps
+    existing users able to log in.
+
     Args:
         plain_password: Plaintext password to verify
         hashed_password: Hashed password from database
@@ -40,12 +99,38 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    password_bytes = plain_password.encode("utf-8")
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
+    if hashed_password.startswith("$argon2"):
+        if _argon2 is None:
+            raise RuntimeError("Verifying argon2 hashes requires the argon2-cffi package")
+        try:
+            return _argon2.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    return bcrypt.checkpw(
+        _bcrypt_password(plain_password), hashed_password.encode("utf-8")
+    )
+
+
+# Hashing is CPU-bound but releases the GIL, so one thread per core keeps it
+# off the event loop without starving the default executor
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="password-hash"
+)
 
-    hashed_bytes = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+async def hash_password_async(plain_password: str) -> str:
+    """Run hash_password in the password executor, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, hash_password, plain_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Run verify_password in the password executor, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
 
 
 def create_access_token(
@@ -64,10 +149,11 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
-    settings = get_settings()
+    if _jwt_secret_key is None:
+        _load_jwt_settings()
 
     if expires_delta is None:
-        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expires_delta = _access_token_expire
 
     now = datetime.now(timezone.utc)
     expire = now + expires_delta
@@ -81,8 +167,8 @@ def create_access_token(
 
     encoded_jwt = jwt.encode(
         payload,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
+        _jwt_secret_key,
+        algorithm=_jwt_algorithm,
     )
 
     return encoded_jwt
@@ -99,19 +185,21 @@ def decode_access_token(token: str) -> dict:
         Decoded token payload dictionary
 
     Raises:
-        JWTError: If token is invalid, expired, or malformed
+        jwt.PyJWTError: If token is invalid, expired, or malformed
     """
-    settings = get_settings()
+    if _jwt_secret_key is None:
+        _load_jwt_settings()
 
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
+            _jwt_secret_key,
+            algorithms=[_jwt_algorithm],
+            options={"require": ["exp", "sub"]},
         )
         return payload
-    except JWTError as e:
-        raise JWTError(f"Invalid token: {str(e)}") from e
+    except jwt.PyJWTError as e:
+        raise jwt.InvalidTokenError(f"Invalid token: {str(e)}") from e
 
 
 def verify_token_claims(payload: dict) -> tuple[str, list[str]]:
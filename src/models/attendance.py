@@ -3,11 +3,11 @@
 import enum
 from datetime import date
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
 
 
 class AttendanceStatus(str, enum.Enum):
@@ -23,7 +23,7 @@ class Attendance(SQLModel, TimestampMixin, table=True):
 
     __tablename__ = "attendance"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id", index=True)
     session_id: UUID = Field(foreign_key="training_sessions.id", index=True)
     enrollment_id: UUID = Field(foreign_key="enrollments.id", index=True)
@@ -1,12 +1,14 @@
 """Badge model."""
 
+import bisect
 import enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
 
 
 class BadgeType(str, enum.Enum):
@@ -18,13 +20,30 @@ class BadgeType(str, enum.Enum):
     PLATINUM = "PLATINUM"
 
 
+# Minimum yearly learning hours for each tier, ascending
+BADGE_TIER_HOURS = (20, 40, 60, 80)
+BADGE_TIERS = (BadgeType.BRONZE, BadgeType.SILVER, BadgeType.GOLD, BadgeType.PLATINUM)
+
+
+def badge_type_for_hours(hours: float) -> BadgeType | None:
+    """Return the highest badge tier reached by the given learning hours."""
+    tier = bisect.bisect_right(BADGE_TIER_HOURS, hours) - 1
+    return BADGE_TIERS[tier] if tier >= 0 else None
+
+
 class Badge(SQLModel, TimestampMixin, table=True):
     """Badge model for gamification rewards."""
 
     __tablename__ = "badges"
-
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True)
+    # One badge per user per year; its index also serves lookups by user_id
+    __table_args__ = (
+        UniqueConstraint("user_id", "year_earned", name="uq_badges_user_id_year_earned"),
+        # MAX(updated_at) for the dashboard ETag
+        Index("ix_badges_updated_at", "updated_at"),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id")
     badge_type: BadgeType = Field(index=True)
     year_earned: int = Field(index=True)
     hours_completed: float = Field(ge=0)
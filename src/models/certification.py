@@ -2,11 +2,11 @@
 
 from datetime import date
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
 
 
 class Certification(SQLModel, TimestampMixin, table=True):
@@ -14,7 +14,7 @@ class Certification(SQLModel, TimestampMixin, table=True):
 
     __tablename__ = "certifications"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id", index=True)
     name: str = Field(max_length=255)
     issuing_organization: str = Field(max_length=255)
@@ -2,19 +2,22 @@
 
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from sqlalchemy import DDL, Index, event
 from sqlmodel import Field, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
 
 
 class TrainingCompletion(SQLModel, TimestampMixin, table=True):
     """TrainingCompletion model for tracking training completion."""
 
     __tablename__ = "training_completions"
+    # MAX(updated_at) for the dashboard ETag
+    __table_args__ = (Index("ix_training_completions_updated_at", "updated_at"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id", index=True)
     training_id: UUID = Field(foreign_key="trainings.id", index=True)
     enrollment_id: UUID = Field(foreign_key="enrollments.id", unique=True, index=True)
@@ -31,3 +34,43 @@ class TrainingCompletion(SQLModel, TimestampMixin, table=True):
     # Certificate
     certificate_issued: bool = Field(default=False)
     certificate_url: Optional[str] = Field(default=None, max_length=500)
+
+
+# Keep profiles.total_learning_hours equal to the user's summed
+# training_completions.learning_hours by applying each row's delta.
+# Same SQL as migration a5c3e7f9b214, so create_all matches Alembic.
+event.listen(
+    TrainingCompletion.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION update_profile_learning_hours() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE profiles
+                SET total_learning_hours = total_learning_hours - OLD.learning_hours
+                WHERE user_id = OLD.user_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE profiles
+                SET total_learning_hours = total_learning_hours + NEW.learning_hours
+                WHERE user_id = NEW.user_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    TrainingCompletion.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE TRIGGER trg_training_completions_profile_hours
+        AFTER INSERT OR DELETE OR UPDATE OF learning_hours, user_id
+        ON training_completions
+        FOR EACH ROW EXECUTE FUNCTION update_profile_learning_hours()
+        """
+    ).execute_if(dialect="postgresql"),
+)
@@ -2,12 +2,12 @@
 
 import enum
 from typing import Optional, List
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import JSON, Column
 from sqlmodel import Field, SQLModel, Relationship
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
 
 
 class LessonType(str, enum.Enum):
@@ -21,20 +21,23 @@ class Module(SQLModel, TimestampMixin, table=True):
     """Module model representing a section of a training."""
     __tablename__ = "modules"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     training_id: UUID = Field(foreign_key="trainings.id", index=True)
     title: str = Field(max_length=255)
     order: int = Field(default=0)
 
-    # Relationship to lessons (will be populated by join)
-    # lessons: List["Lesson"] = Relationship(back_populates="module")
+    # Lessons in display order; load with selectinload(Module.lessons)
+    lessons: List["Lesson"] = Relationship(
+        back_populates="module",
+        sa_relationship_kwargs={"order_by": "Lesson.order", "lazy": "raise"},
+    )
 
 
 class Lesson(SQLModel, TimestampMixin, table=True):
     """Lesson model representing a unit of content."""
     __tablename__ = "lessons"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     module_id: UUID = Field(foreign_key="modules.id", index=True)
     title: str = Field(max_length=255)
     type: LessonType = Field(default=LessonType.VIDEO)
@@ -46,4 +49,6 @@ class Lesson(SQLModel, TimestampMixin, table=True):
     # Store questions as JSON for simplicity in this hackathon context
     questions: List[dict] = Field(default_factory=list, sa_column=Column(JSON))
 
-    # module: Module = Relationship(back_populates="lessons")
+    module: Module = Relationship(
+        back_populates="lessons", sa_relationship_kwargs={"lazy": "raise"}
+    )
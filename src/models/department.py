@@ -1,17 +1,20 @@
 """Department model."""
 
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
 
 
 class Department(SQLModel, TimestampMixin, table=True):
     """Department model representing organizational units."""
 
     __tablename__ = "departments"
+    # MAX(updated_at) for the dashboard ETag
+    __table_args__ = (Index("ix_departments_updated_at", "updated_at"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     name: str = Field(unique=True, max_length=255, index=True)
     description: str | None = Field(default=None, max_length=1000)
@@ -2,12 +2,20 @@
 
 import enum
 from datetime import datetime
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import CheckConstraint, Index
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Field, Relationship, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import BasisPoints, TimestampMixin, uuid7
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.models.training import Training, TrainingSession
+    from src.models.user import User
 
 
 class EnrollmentStatus(str, enum.Enum):
@@ -24,9 +32,22 @@ class Enrollment(SQLModel, TimestampMixin, table=True):
     """Enrollment model tracking user training enrollments."""
 
     __tablename__ = "enrollments"
+    # One enrollment per user and training; also serves lookups by user_id
+    __table_args__ = (
+        Index("ix_enrollments_user_training", "user_id", "training_id", unique=True),
+        # Serves the per-user list: ORDER BY created_at DESC, id DESC
+        Index("ix_enrollments_user_created_at_id", "user_id", "created_at", "id"),
+        # MAX(updated_at) for the dashboard ETag
+        Index("ix_enrollments_updated_at", "updated_at"),
+        # Stored in basis points, so 0-100% is 0-10000
+        CheckConstraint(
+            "completion_percentage BETWEEN 0 AND 10000",
+            name="ck_enrollments_completion_percentage",
+        ),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id")
     training_id: UUID = Field(foreign_key="trainings.id", index=True)
     session_id: Optional[UUID] = Field(
         default=None, foreign_key="training_sessions.id", index=True
@@ -40,4 +61,65 @@ class Enrollment(SQLModel, TimestampMixin, table=True):
 
     # Completion tracking
     completed_at: Optional[datetime] = Field(default=None)
-    completion_percentage: float = Field(default=0.0, ge=0, le=100)
+    completion_percentage: float = Field(default=0.0, sa_type=BasisPoints)
+
+    training: "Training" = Relationship(
+        back_populates="enrollments", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    user: "User" = Relationship(
+        back_populates="enrollments",
+        sa_relationship_kwargs={"lazy": "raise", "foreign_keys": "Enrollment.user_id"},
+    )
+    session: Optional["TrainingSession"] = Relationship(
+        sa_relationship_kwargs={"lazy": "raise"}
+    )
+
+    @classmethod
+    async def bulk_assign(
+        cls,
+        session: "AsyncSession",
+        training_id: UUID,
+        user_ids: list[UUID],
+        assigned_by_id: Optional[UUID] = None,
+        session_id: Optional[UUID] = None,
+    ) -> dict[UUID, UUID]:
+        """
+        Assign a training to many users in one INSERT ... RETURNING.
+
+        Users already enrolled in the training are skipped by the
+        (user_id, training_id) unique index rather than failing the batch.
+
+        Args:
+            session: Database session (not committed here)
+            training_id: Training to assign
+            user_ids: Users to enroll
+            assigned_by_id: Manager making the assignment
+            session_id: Optional training session to book
+
+        Returns:
+            New enrollment id keyed by user_id, for the users actually enrolled
+        """
+        if not user_ids:
+            return {}
+
+        assigned_at = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid7(),
+                "user_id": user_id,
+                "training_id": training_id,
+                "session_id": session_id,
+                "status": EnrollmentStatus.ENROLLED,
+                "is_assigned": True,
+                "assigned_by_id": assigned_by_id,
+                "assigned_at": assigned_at,
+            }
+            for user_id in dict.fromkeys(user_ids)
+        ]
+        result = await session.execute(
+            pg_insert(cls)
+            .on_conflict_do_nothing(index_elements=["user_id", "training_id"])
+            .returning(cls.user_id, cls.id),
+            rows,
+        )
+        return dict(result.all())
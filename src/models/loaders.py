@@ -0,0 +1,22 @@
+"""Eager-loading option sets for model relationships.
+
+Relationships are declared ``lazy="raise"``, so navigating one that was not
+loaded up front fails loudly instead of issuing a query per row. Pass these
+to ``select(...).options(*...)`` wherever a route walks relationships; each
+set ends with ``raiseload("*")`` so anything it does not name stays guarded.
+"""
+
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from src.models.enrollment import Enrollment
+
+
+def load_enrollment_full() -> list[LoaderOption]:
+    """Load an enrollment's user and training."""
+    return [
+        selectinload(Enrollment.user),
+        selectinload(Enrollment.training),
+        raiseload("*"),
+    ]
+
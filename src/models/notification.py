@@ -1,12 +1,16 @@
 """Notification model."""
 
 import enum
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, text
+from sqlmodel import Field, Relationship, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
+
+if TYPE_CHECKING:
+    from src.models.user import User
 
 
 class NotificationType(str, enum.Enum):
@@ -26,11 +30,27 @@ class Notification(SQLModel, TimestampMixin, table=True):
     """Notification model for user notifications."""
 
     __tablename__ = "notifications"
-
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True)
+    __table_args__ = (
+        # Serves the per-user feed: ORDER BY created_at DESC, id DESC
+        Index("ix_notifications_user_created_at_id", "user_id", "created_at", "id"),
+        # Unread rows are a small, bounded slice of the table; the
+        # unread_only filter uses just those
+        Index(
+            "ix_notifications_unread",
+            "user_id",
+            "created_at",
+            postgresql_where=text("is_read = false"),
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id")
     notification_type: NotificationType = Field(index=True)
     title: str = Field(max_length=255)
     message: str = Field(max_length=1000)
-    is_read: bool = Field(default=False, index=True)
+    is_read: bool = Field(default=False)
     action_url: Optional[str] = Field(default=None, max_length=500)
+
+    user: "User" = Relationship(
+        back_populates="notifications", sa_relationship_kwargs={"lazy": "raise"}
+    )
@@ -1,12 +1,17 @@
 """Profile model."""
 
-from typing import Optional
-from uuid import UUID, uuid4
+from datetime import date
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
-from sqlalchemy import JSON, Column
-from sqlmodel import Field, SQLModel
+from sqlalchemy import DDL, Column, Text, event
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Field, Relationship, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
+
+if TYPE_CHECKING:
+    from src.models.user import User
 
 
 class Profile(SQLModel, TimestampMixin, table=True):
@@ -14,13 +19,49 @@ class Profile(SQLModel, TimestampMixin, table=True):
 
     __tablename__ = "profiles"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id", unique=True, index=True)
     phone: Optional[str] = Field(default=None, max_length=20)
     location: Optional[str] = Field(default=None, max_length=255)
     bio: Optional[str] = Field(default=None, max_length=2000)
-    tech_stack: list[str] = Field(default_factory=list, sa_column=Column(JSON))
-    skills: list[str] = Field(default_factory=list, sa_column=Column(JSON))
+    tech_stack: list[str] = Field(default_factory=list, sa_column=Column(ARRAY(Text)))
+    skills: list[str] = Field(default_factory=list, sa_column=Column(ARRAY(Text)))
+    # Trigger-maintained from training_completions; do not update from the app
     total_learning_hours: float = Field(default=0.0)
     streak_count: int = Field(default=0)
-    last_active_date: Optional[str] = Field(default=None) # ISO format date string YYYY-MM-DD
+    last_active_date: Optional[date] = Field(default=None)
+
+    user: "User" = Relationship(
+        back_populates="profile", sa_relationship_kwargs={"lazy": "raise"}
+    )
+
+
+# Profiles are created lazily, possibly after completions exist.
+# Same SQL as migration a5c3e7f9b214, so create_all matches Alembic.
+event.listen(
+    Profile.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION init_profile_learning_hours() RETURNS trigger AS $$
+        BEGIN
+            SELECT coalesce(sum(learning_hours), 0) INTO NEW.total_learning_hours
+            FROM training_completions
+            WHERE user_id = NEW.user_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Profile.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE TRIGGER trg_profiles_init_learning_hours
+        BEFORE INSERT ON profiles
+        FOR EACH ROW EXECUTE FUNCTION init_profile_learning_hours()
+        """
+    ).execute_if(dialect="postgresql"),
+)
@@ -2,19 +2,24 @@
 
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
 
 
 class LessonProgress(SQLModel, TimestampMixin, table=True):
     """Model to track user progress on individual lessons."""
     __tablename__ = "lesson_progress"
+    # One progress row per user and lesson; also serves lookups by user_id
+    __table_args__ = (
+        Index("ix_lesson_progress_user_lesson", "user_id", "lesson_id", unique=True),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id")
     lesson_id: UUID = Field(foreign_key="lessons.id", index=True)
     completed_at: Optional[datetime] = Field(default=None)
     is_completed: bool = Field(default=False)
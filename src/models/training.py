@@ -1,14 +1,20 @@
 """Training and TrainingSession models."""
 
 import enum
-from datetime import date, datetime
-from typing import Optional
-from uuid import UUID, uuid4
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
-from sqlalchemy import JSON, Column
-from sqlmodel import Field, SQLModel
+from sqlalchemy import CheckConstraint, Column, Index, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Field, Relationship, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
+
+if TYPE_CHECKING:
+    from src.models.content import Module
+    from src.models.enrollment import Enrollment
+    from src.models.user import User
 
 
 class TrainingStatus(str, enum.Enum):
@@ -28,13 +34,23 @@ class Training(SQLModel, TimestampMixin, table=True):
     """Training model representing training programs."""
 
     __tablename__ = "trainings"
+    # Backs keyset pagination: ORDER BY created_at DESC, id DESC
+    __table_args__ = (
+        Index("ix_trainings_created_at_id", "created_at", "id"),
+        # Category-filtered listing: WHERE category = ? ORDER BY created_at, id
+        Index("ix_trainings_category_created_at_id", "category", "created_at", "id"),
+        # MAX(updated_at) for the dashboard ETag
+        Index("ix_trainings_updated_at", "updated_at"),
+        CheckConstraint("duration_hours > 0", name="ck_trainings_duration_hours"),
+        CheckConstraint("max_participants > 0", name="ck_trainings_max_participants"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     title: str = Field(max_length=255, index=True)
     description: str = Field(max_length=2000)
-    category: str = Field(max_length=100, index=True)
-    duration_hours: float = Field(gt=0)
-    max_participants: int = Field(gt=0)
+    category: str = Field(max_length=100)
+    duration_hours: float
+    max_participants: int
     is_mandatory: bool = Field(default=False)
     status: TrainingStatus = Field(default=TrainingStatus.DRAFT, index=True)
 
@@ -45,8 +61,10 @@ class Training(SQLModel, TimestampMixin, table=True):
     rejection_reason: Optional[str] = Field(default=None, max_length=1000)
 
     # Content fields
-    prerequisites: list[str] = Field(default_factory=list, sa_column=Column(JSON))
-    learning_objectives: list[str] = Field(default_factory=list, sa_column=Column(JSON))
+    prerequisites: list[str] = Field(default_factory=list, sa_column=Column(ARRAY(Text)))
+    learning_objectives: list[str] = Field(
+        default_factory=list, sa_column=Column(ARRAY(Text))
+    )
     materials_url: Optional[str] = Field(default=None, max_length=500)
 
     # Creator (nullable for now - will be required when JWT auth is enabled)
@@ -54,18 +72,51 @@ class Training(SQLModel, TimestampMixin, table=True):
         default=None, foreign_key="users.id", index=True
     )
 
+    # Lazy loads raise; use selectinload(Training.enrollments) explicitly
+    enrollments: list["Enrollment"] = Relationship(
+        back_populates="training", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    sessions: list["TrainingSession"] = Relationship(
+        back_populates="training", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    creator: Optional["User"] = Relationship(
+        sa_relationship_kwargs={"lazy": "raise", "foreign_keys": "Training.created_by_id"}
+    )
+
+    # Modules in display order; load with selectinload(Training.modules)
+    modules: list["Module"] = Relationship(
+        sa_relationship_kwargs={
+            "order_by": "Module.order",
+            "lazy": "raise",
+            "passive_deletes": True,
+        }
+    )
+
 
 class TrainingSession(SQLModel, TimestampMixin, table=True):
     """TrainingSession model for scheduled training sessions."""
 
     __tablename__ = "training_sessions"
+    __table_args__ = (
+        CheckConstraint(
+            "max_participants > 0", name="ck_training_sessions_max_participants"
+        ),
+        CheckConstraint(
+            "current_participants >= 0 AND current_participants <= max_participants",
+            name="ck_training_sessions_current_participants",
+        ),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     training_id: UUID = Field(foreign_key="trainings.id", index=True)
     session_date: date = Field(index=True)
-    start_time: str = Field(max_length=5)  # HH:MM format
-    end_time: str = Field(max_length=5)  # HH:MM format
+    start_time: time
+    end_time: time
     location: str = Field(max_length=255)
     instructor_name: str = Field(max_length=255)
-    max_participants: int = Field(gt=0)
-    current_participants: int = Field(default=0, ge=0)
+    max_participants: int
+    current_participants: int = Field(default=0)
+
+    training: Training = Relationship(
+        back_populates="sessions", sa_relationship_kwargs={"lazy": "raise"}
+    )
@@ -1,12 +1,18 @@
 """User model and related enums."""
 
 import enum
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Index
+from sqlmodel import Field, Relationship, SQLModel
 
-from src.core.db import TimestampMixin
+from src.core.db import TimestampMixin, uuid7
+
+if TYPE_CHECKING:
+    from src.models.enrollment import Enrollment
+    from src.models.notification import Notification
+    from src.models.profile import Profile
 
 
 class UserRole(str, enum.Enum):
@@ -22,8 +28,14 @@ class User(SQLModel, TimestampMixin, table=True):
     """User model representing system users."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Backs keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # MAX(updated_at) for the dashboard ETag
+        Index("ix_users_updated_at", "updated_at"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     email: str = Field(unique=True, index=True, max_length=255)
     hashed_password: str = Field(max_length=255)
     full_name: str = Field(max_length=255)
@@ -33,3 +45,15 @@ class User(SQLModel, TimestampMixin, table=True):
         default=None, foreign_key="departments.id", index=True
     )
     manager_id: Optional[UUID] = Field(default=None, foreign_key="users.id", index=True)
+
+    # Lazy loads raise; see src.models.loaders for the eager-load options
+    enrollments: list["Enrollment"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"lazy": "raise", "foreign_keys": "Enrollment.user_id"},
+    )
+    notifications: list["Notification"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    profile: Optional["Profile"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise", "uselist": False}
+    )